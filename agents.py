@@ -0,0 +1,113 @@
+"""
+Script Name: Agent Interface, Registry and Game Driver for Tic-Tac-Toe
+Description: This module defines the interface every Tic-Tac-Toe agent implements, a registry that creates agents by name, and the one game loop that plays two agents against each other.
+Date: October 18, 2026
+"""
+
+# An agent has three methods:
+#   select_move(state, budget=None, rng=None)  the cell to play for the side to move in `state` (an engine Position, or any game with its interface), without changing `state`;
+#                                              `budget` is a time budget in seconds for agents that can search anytime (None for their usual amount of work)
+#                                              and `rng` the numpy Generator to draw from (see seeding.py)
+#   observe(transition)                        called after every move of the game, both sides' moves, with a Transition; learning agents update here
+#   reset()                                    called at the start of every game, to drop what the agent kept from the previous one
+
+# The registry maps names to "module:attribute" and imports the module only when an agent is created. The attribute is either an Agent class,
+# created with the given parameters, or a move function written for the original scripts (list board in, (row, col) for 'O' out),
+# which `MoveFunctionAgent` adapts: it shows the function the board with the colours swapped when the agent plays 'X' and passes the budget as `time_budget`
+# if the function takes one. Other modules add agents with `register`.
+
+# `play_game` is the game loop used by self-play, evaluation and the tournament.
+
+
+import importlib
+import inspect
+import time
+from collections import namedtuple
+from engine import O, X, Position, move_to_cell
+from seeding import get_rng
+
+# `player` played `cell`, giving `state` (the live game: copy it to keep it)
+Transition = namedtuple('Transition', ['player', 'cell', 'state'])
+
+# Agent name -> "module:attribute"
+AGENTS = {
+    'random': 'agents:RandomAgent',
+    'optimal': 'solver:optimal_move',
+    'mc': 'monteclaro:monte_carlo_rollout',
+    'mcts': 'monteclaro:MCTSSearchAgent',
+    'sparse': 'sparsesampling:sparse_sampling',
+    'td': 'temporallearning:TDAgent',
+    'alphabeta': 'alphabeta:AlphaBetaAgent',
+}
+
+
+class Agent:
+    def select_move(self, state, budget=None, rng=None):
+        raise NotImplementedError
+
+    def observe(self, transition):
+        pass
+
+    def reset(self):
+        pass
+
+
+# Agent around a move function for 'O' on a list board; `params` are passed to every call
+class MoveFunctionAgent(Agent):
+    def __init__(self, move_fn, **params):
+        self.move_fn = move_fn
+        self.params = params
+        self.takes_budget = 'time_budget' in inspect.signature(move_fn).parameters
+
+    def select_move(self, state, budget=None, rng=None):
+        board = state.to_board()
+        params = dict(self.params, time_budget=budget) if budget is not None and self.takes_budget else self.params
+        return move_to_cell(self.move_fn(board if state.turn == O else swap_colours(board), rng=rng, **params))
+
+
+# Uniformly random legal move
+class RandomAgent(Agent):
+    def select_move(self, state, budget=None, rng=None):
+        moves = state.legal_moves()
+        return moves[get_rng(rng).integers(len(moves))]
+
+
+# Swap X and O so that a move function written for 'O' can play 'X'
+def swap_colours(board):
+    swap = {'X': 'O', 'O': 'X', ' ': ' '}
+    return [[swap[cell] for cell in row] for row in board]
+
+# Add an agent to the registry; `target` is "module:attribute"
+def register(name, target):
+    AGENTS[name] = target
+
+# Create the agent registered as `name`
+def make_agent(name, **params):
+    if name not in AGENTS:
+        raise ValueError(f"unknown agent {name!r}")
+    module_name, attribute = AGENTS[name].split(':')
+    target = getattr(importlib.import_module(module_name), attribute)
+    return target(**params) if isinstance(target, type) else MoveFunctionAgent(target, **params)
+
+
+# Play one game between two agents (they may be the same object) from `state` (an empty board with `first` to move by default)
+# Returns the winner (X, O or None), the cells played and the seconds each decision took
+def play_game(agent_x, agent_o, first=X, budget=None, rng=None, state=None):
+    state = Position(turn=first) if state is None else state
+    agents = {X: agent_x, O: agent_o}
+    players = [agent_x] if agent_o is agent_x else [agent_x, agent_o]
+    for agent in players:
+        agent.reset()
+    moves = []
+    seconds = []
+    while not state.is_terminal():
+        player = state.turn
+        start = time.perf_counter()
+        cell = agents[player].select_move(state, budget, rng)
+        seconds.append(time.perf_counter() - start)
+        state.play(cell)
+        moves.append(cell)
+        transition = Transition(player, cell, state)
+        for agent in players:
+            agent.observe(transition)
+    return state.winner(), moves, seconds
@@ -0,0 +1,179 @@
+"""
+Script Name: Alpha-Beta Negamax Agent for Tic-Tac-Toe and m,n,k Boards
+Description: This module implements an adversarial search agent: negamax with alpha-beta pruning and iterative deepening under a time budget, killer/history/principal-variation move ordering and a Zobrist-hashed transposition table.
+Date: October 18, 2026
+"""
+
+# The search works on any game with the engine Position interface (`legal_moves`, `play`, `undo`, `winner`, `is_full`, `turn`, `to_board`), so it plays the
+# standard game and larger `MNKBoard` variants alike. Values are from the point of view of the side to move: a win is WIN_SCORE less the number of plies to it,
+# so faster wins and slower losses are preferred, a draw is 0, and a position at the depth limit gets `evaluate(state)` (0 unless an evaluation is given).
+
+# Iterative deepening searches depth 1, 2, ... up to `max_depth` (every empty cell by default) and keeps the best move of the last completed depth;
+# with a time budget the search in progress is abandoned when it runs out. It stops early once the root value is a proven win or loss.
+
+# Moves are tried in this order: the move stored for the position in the transposition table (the principal variation of the previous depth),
+# the two killer moves of the ply (moves that caused a cutoff in a sibling position), then the rest by their history score (depth squared added on every cutoff).
+
+# Positions are hashed with Zobrist keys: one random 64-bit key per (player, cell) and one for 'O' to move, combined with XOR. The root hash is computed once per decision
+# and every make/unmake updates it with two XORs. The transposition table maps a hash to (depth, value, bound, best move), where bound says whether the value is exact,
+# a lower bound (the search failed high) or an upper bound (it failed low). Win and loss values are stored relative to the position, so they stay correct at any ply.
+
+
+import time
+import numpy as np
+from agents import Agent
+from engine import O, SYMBOLS
+from instrument import count, decision
+
+WIN_SCORE = 1 << 20
+EXACT, LOWER, UPPER = 0, 1, 2
+ZOBRIST_SEED = 20240426
+CHECK_INTERVAL = 1024  # nodes between deadline checks
+MAX_ENTRIES = 1 << 20  # transposition table entries before it is cleared
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class AlphaBetaAgent(Agent):
+    def __init__(self, max_depth=None, time_budget=None, evaluate=None):
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        self.evaluate = evaluate
+        self.zobrist = None
+        self.reset()
+
+    # Forget the transposition table and the ordering statistics
+    def reset(self):
+        self.table = {}
+        self.killers = []
+        self.history = None
+
+    # Zobrist keys for a board of `num_cells` cells; the same keys for every agent, so hashes are reproducible
+    def _keys(self, num_cells):
+        if self.zobrist is None or len(self.zobrist[0]) != num_cells:
+            keys = np.random.default_rng(ZOBRIST_SEED).integers(1, 1 << 63, size=2 * num_cells + 1, dtype=np.int64).tolist()
+            self.zobrist = (keys[:num_cells], keys[num_cells:2 * num_cells])
+            self.side_key = keys[-1]
+            self.table = {}
+            self.history = None
+        if self.history is None:
+            self.history = ([0] * num_cells, [0] * num_cells)
+        return self.zobrist
+
+    # Zobrist hash of `state`, computed from scratch
+    def hash(self, state):
+        cells = [symbol for row in state.to_board() for symbol in row]
+        zobrist = self._keys(len(cells))
+        value = self.side_key if state.turn == O else 0
+        for cell, symbol in enumerate(cells):
+            if symbol != ' ':
+                value ^= zobrist[SYMBOLS.index(symbol)][cell]
+        return value
+
+    # Iterative deepening from `state`; a `budget` (seconds) replaces `time_budget` for this call
+    @decision('alphabeta')
+    def select_move(self, state, budget=None, rng=None):
+        if state.is_terminal():
+            raise ValueError("the game is already over")
+        state = state.copy()
+        root_hash = self.hash(state)
+        time_budget = budget if budget is not None else self.time_budget
+        self.deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        self.nodes = 0
+        self.hits = 0
+        empty = sum(symbol == ' ' for row in state.to_board() for symbol in row)
+        max_depth = empty if self.max_depth is None else min(self.max_depth, empty)
+        if len(self.table) > MAX_ENTRIES:
+            self.table = {}
+
+        best_move = state.legal_moves()[0]
+        try:
+            for depth in range(1, max_depth + 1):
+                self.killers = [[None, None] for _ in range(depth + 1)]
+                value = self._search(state, depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0, root_hash)
+                best_move = self.table[root_hash][3]
+                if abs(value) > WIN_SCORE - empty - 1:
+                    break  # proven win or loss: a deeper search cannot change the move
+        except SearchTimeout:
+            pass
+        count('nodes_expanded', self.nodes)
+        count('cache_hits', self.hits)
+        count('win_checks', self.nodes)
+        return best_move
+
+    def _search(self, state, depth, alpha, beta, ply, key):
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % CHECK_INTERVAL == 0 and time.perf_counter() >= self.deadline:
+            raise SearchTimeout
+        if state.winner() is not None:
+            return ply - WIN_SCORE  # the previous move won
+        if state.is_full():
+            return 0
+        if depth == 0:
+            return self.evaluate(state) if self.evaluate is not None else 0
+
+        original_alpha = alpha
+        entry = self.table.get(key)
+        table_move = None
+        if entry is not None:
+            entry_depth, entry_value, bound, table_move = entry
+            if entry_depth >= depth:
+                self.hits += 1
+                value = from_table(entry_value, ply)
+                if bound == EXACT:
+                    return value
+                if bound == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        player = state.turn
+        keys, history = self.zobrist[player], self.history[player]
+        killers = self.killers[ply]
+        moves = sorted(state.legal_moves(), key=lambda cell: -history[cell])
+        for cell in reversed(killers):
+            if cell is not None and cell in moves:
+                moves.remove(cell)
+                moves.insert(0, cell)
+        if table_move is not None and table_move in moves:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+
+        best_value, best_move = -WIN_SCORE - 1, moves[0]
+        for cell in moves:
+            state.play(cell)
+            value = -self._search(state, depth - 1, -beta, -alpha, ply + 1, key ^ keys[cell] ^ self.side_key)
+            state.undo(cell)
+            if value > best_value:
+                best_value, best_move = value, cell
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                if killers[0] != cell:
+                    killers[1], killers[0] = killers[0], cell
+                history[cell] += depth * depth
+                break
+
+        bound = UPPER if best_value <= original_alpha else LOWER if best_value >= beta else EXACT
+        self.table[key] = (depth, to_table(best_value, ply), bound, best_move)
+        return best_value
+
+
+# Win and loss values are stored as distances from the position, not from the root
+def to_table(value, ply):
+    if value > WIN_SCORE // 2:
+        return value + ply
+    if value < -WIN_SCORE // 2:
+        return value - ply
+    return value
+
+def from_table(value, ply):
+    if value > WIN_SCORE // 2:
+        return value - ply
+    if value < -WIN_SCORE // 2:
+        return value + ply
+    return value
@@ -0,0 +1,129 @@
+"""
+Script Name: Batched Move Selection for Many Concurrent Games
+Description: This module chooses the 'O' move for K positions in one call, sharing rollout batches, value-table lookups and transposition-table entries across the whole batch.
+Date: October 18, 2026
+"""
+
+# Positions come in as a stacked (K, 9) int8 array in the batch simulator encoding (0 empty, 1 X, 2 O); `encode_boards` converts list boards.
+# `select_moves(boards, agent)` returns a (K,) array of cells, one per position, all for 'O' to move.
+# Every position must still be in play: a board that is full or already has a line raises ValueError before any backend runs.
+
+#   mc       - one `simulate` call for every candidate move of every position not already in the shared transposition table;
+#              symmetric copies within the batch are simulated once and results are stored under the same keys `monte_carlo_rollout` uses
+#   td       - all K x 9 afterstates are canonicalized and looked up in the TD value table with array indexing,
+#              or evaluated with one feature extraction and one matrix product when the table is a `LinearValue`
+#   optimal  - one fancy-index into the solver table
+#   sparse   - `sparse_sampling` per position with a single shared transposition table, so later positions reuse subtrees of earlier ones
+#   mcts     - `MCTSAgent` per position
+
+
+import numpy as np
+from batchsim import EMPTY, O_CELL, X_CELL, rewards, simulate, winners
+from engine import BOARD_ROWS, BOARD_COLS, NUM_CELLS, NUM_STATES, O, X, move_to_cell
+from linearvalue import LinearValue
+from symmetry import SYMMETRIES, canonical_arrays, shared_table
+
+POWERS = 3 ** np.arange(NUM_CELLS)
+SYMBOL_CELLS = {' ': EMPTY, 'X': X_CELL, 'O': O_CELL}
+
+
+# Stack list boards into a (K, 9) int8 array
+def encode_boards(boards):
+    return np.array([[SYMBOL_CELLS[symbol] for row in board for symbol in row] for board in boards], dtype=np.int8).reshape(-1, NUM_CELLS)
+
+# Convert one (9,) row back to a list board
+def decode_board(cells):
+    symbols = (' ', 'X', 'O')
+    return [[symbols[cells[row * BOARD_COLS + col]] for col in range(BOARD_COLS)] for row in range(BOARD_ROWS)]
+
+# Monte Carlo rollouts for the whole batch in one simulation
+def batch_mc(boards, num_episodes=10000, rng=None, table=shared_table):
+    if table is None:
+        table = {}
+    canonical_index, canonical_symmetry = canonical_arrays()
+    indices = boards @ POWERS
+    keys = [('mc', int(index), num_episodes) for index in canonical_index[indices]]
+
+    # Simulate one representative of every canonical position that is not cached yet
+    missing = {}
+    simulated = {}
+    for k, key in enumerate(keys):
+        if key not in missing and table.get(key) is None:
+            missing[key] = k
+    if missing:
+        representatives = np.fromiter(missing.values(), dtype=np.intp)
+        positions, cells = np.nonzero(boards[representatives] == EMPTY)
+        playouts = np.repeat(boards[representatives[positions]], num_episodes, axis=0)
+        playouts[np.arange(len(playouts)), np.repeat(cells, num_episodes)] = O_CELL
+        means = rewards(simulate(playouts, X_CELL, rng), O_CELL).reshape(-1, num_episodes).mean(axis=1)
+        for position, (key, k) in enumerate(missing.items()):
+            symmetry = SYMMETRIES[canonical_symmetry[indices[k]]]
+            rows = positions == position
+            simulated[key] = table[key] = {symmetry[cell]: reward for cell, reward in zip(cells[rows], means[rows])}
+
+    moves = np.empty(len(boards), dtype=np.intp)
+    for k, key in enumerate(keys):
+        scores = simulated[key] if key in simulated else table.get(key)
+        symmetry = SYMMETRIES[canonical_symmetry[indices[k]]]
+        legal = np.flatnonzero(boards[k] == EMPTY)
+        moves[k] = legal[np.argmax([scores[symmetry[cell]] for cell in legal])]
+    return moves
+
+# Greedy TD move for the whole batch from the value table
+def batch_td(boards, rng=None, table=None):
+    if table is None:
+        from temporallearning import value_table as table
+    num_boards = len(boards)
+    cells = np.arange(NUM_CELLS)
+    afterstates = np.repeat(boards[:, None, :], NUM_CELLS, axis=1)
+    afterstates[:, cells, cells] = O_CELL
+    afterstates = afterstates.reshape(-1, NUM_CELLS)
+
+    if isinstance(table, LinearValue):
+        values = table.batch_values(afterstates, np.full(len(afterstates), X)).astype(np.float64)
+    else:
+        canonical_index = canonical_arrays()[0][afterstates @ POWERS]
+        values = table.values[X * NUM_STATES + canonical_index].astype(np.float64)
+    values[(afterstates != EMPTY).all(axis=1)] = 0.0
+    values[winners(afterstates) == O_CELL] = 1.0
+    values = values.reshape(num_boards, NUM_CELLS)
+    values[boards != EMPTY] = -np.inf
+    return values.argmax(axis=1)
+
+# Perfect-play moves from the solver table
+def batch_optimal(boards, rng=None):
+    from solver import load
+    return load()['move'][O, boards @ POWERS].astype(np.intp)
+
+# Sparse sampling per position with one shared transposition table
+def batch_sparse(boards, rng=None, cache=shared_table, **params):
+    from sparsesampling import sparse_sampling
+    return np.array([move_to_cell(sparse_sampling(decode_board(cells), cache=cache, rng=rng, **params)) for cells in boards], dtype=np.intp)
+
+# MCTS per position
+def batch_mcts(boards, rng=None, **params):
+    from monteclaro import mcts_agent, mcts_search
+    moves = []
+    for cells in boards:
+        mcts_agent.reset()  # positions in a batch come from different games
+        moves.append(move_to_cell(mcts_search(decode_board(cells), rng=rng, **params)))
+    return np.array(moves, dtype=np.intp)
+
+AGENTS = {
+    'mc': batch_mc,
+    'td': batch_td,
+    'optimal': batch_optimal,
+    'sparse': batch_sparse,
+    'mcts': batch_mcts,
+}
+
+
+# Choose the 'O' move for each of K positions; `boards` is a (K, 9) array or a list of list boards
+def select_moves(boards, agent='mc', rng=None, **params):
+    if not isinstance(boards, np.ndarray):
+        boards = encode_boards(boards)
+    boards = np.asarray(boards, dtype=np.int8).reshape(-1, NUM_CELLS)
+    finished = np.flatnonzero((winners(boards) != EMPTY) | (boards != EMPTY).all(axis=1))
+    if len(finished):
+        raise ValueError(f"positions {finished.tolist()} are already over")
+    return AGENTS[agent](boards, rng=rng, **params)
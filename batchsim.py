@@ -0,0 +1,91 @@
+"""
+Script Name: Vectorized Batch Game Simulator for Tic-Tac-Toe
+Description: This module plays many random Tic-Tac-Toe games to the end at once with NumPy, advancing every unfinished game by one move per array operation.
+Date: October 18, 2026
+"""
+
+# Boards are stored as an (N, 9) int8 array with 0 for an empty cell, 1 for X and 2 for O (the same digits as a base-3 encoding of the board).
+# Each step picks a uniformly random empty cell for every unfinished game by masking random keys, places the mover's stone and checks the 8 win lines for the mover only.
+
+# Finished games are dropped from the working set, so each step only touches the games that are still running.
+
+# `monteclaro.monte_carlo_rollout` uses `simulate` to score candidate moves with real random playouts.
+
+
+import numpy as np
+from engine import NUM_CELLS, O, WIN_LINES, WIN_TABLE, X, iter_bits
+from instrument import count
+from seeding import get_rng
+
+# Cell values
+EMPTY, X_CELL, O_CELL = 0, 1, 2
+PLAYER_CELLS = (X_CELL, O_CELL)
+
+# Win lines as an (8, 3) index array
+LINES = np.array(WIN_LINES, dtype=np.intp)
+
+# Engine win table and cell bit values as arrays for vectorized lookups
+WIN_LOOKUP = np.frombuffer(WIN_TABLE, dtype=np.uint8).astype(bool)
+CELL_BITS = (1 << np.arange(NUM_CELLS)).astype(np.int16)
+
+
+# Convert an engine Position to a (9,) int8 board row
+def encode(position):
+    board = np.zeros(NUM_CELLS, dtype=np.int8)
+    for player in (X, O):
+        board[list(iter_bits(position.bits[player]))] = PLAYER_CELLS[player]
+    return board
+
+# Return the winner of each board: 0 for none, X_CELL or O_CELL
+def winners(boards):
+    cells = boards[:, LINES]
+    x_won = (cells == X_CELL).all(axis=2).any(axis=1)
+    o_won = (cells == O_CELL).all(axis=2).any(axis=1)
+    return np.where(x_won, X_CELL, np.where(o_won, O_CELL, EMPTY)).astype(np.int8)
+
+# Play every board to the end with uniformly random moves
+def simulate(boards, to_move, rng=None):
+    rng = get_rng(rng)
+    boards = np.asarray(boards, dtype=np.int8)
+    num_games = len(boards)
+    movers = np.broadcast_to(np.asarray(to_move, dtype=np.int8), (num_games,)).copy()
+
+    results = winners(boards)
+    active = np.flatnonzero((results == EMPTY) & (boards == EMPTY).any(axis=1))
+    count('rollouts', num_games)
+    count('array_bytes', boards.nbytes)
+    count('win_checks', num_games)
+
+    # Working set of unfinished games: their boards, movers and per-player bit masks
+    current = boards[active]
+    player = movers[active]
+    bits = np.stack([(current == cell) @ CELL_BITS for cell in PLAYER_CELLS], axis=1).astype(np.int16)
+
+    while active.size:
+        rows = np.arange(active.size)
+
+        # Random legal move: the largest random key among the empty cells
+        keys = rng.random(current.shape, dtype=np.float32)
+        keys[current != EMPTY] = -1.0
+        cells = keys.argmax(axis=1)
+        current[rows, cells] = player
+
+        # Only the player who just moved can have completed a line
+        side = player - 1
+        bits[rows, side] |= CELL_BITS[cells]
+        won = WIN_LOOKUP[bits[rows, side]]
+        count('win_checks', active.size)
+        results[active[won]] = player[won]
+
+        player = PLAYER_CELLS[0] + PLAYER_CELLS[1] - player
+        full = (bits[:, 0] | bits[:, 1]) == (1 << NUM_CELLS) - 1
+        keep = ~(won | full)
+        if not keep.all():
+            active, current, player, bits = active[keep], current[keep], player[keep], bits[keep]
+
+    return results
+
+# Score results from one player's side: 1 for a win, 0 for a draw, -1 for a loss
+def rewards(results, player_cell):
+    opponent_cell = PLAYER_CELLS[0] + PLAYER_CELLS[1] - player_cell
+    return (results == player_cell).astype(np.float32) - (results == opponent_cell)
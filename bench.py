@@ -0,0 +1,225 @@
+"""
+Script Name: Benchmark Suite for the Tic-Tac-Toe Agents
+Description: This script times every agent on a fixed corpus of opening, midgame and endgame positions and writes decision latency, throughput and memory figures as JSON.
+Date: October 18, 2026
+"""
+
+# Each agent runs in its own child process so that its peak resident memory is measured on its own. Per agent the report has:
+#   p50/p99/mean decision latency in milliseconds, decisions per second,
+#   rollouts per second (playouts simulated) and nodes per second (search nodes or cached subtree values created) where the agent has them,
+#   and the peak RSS of the process in megabytes.
+# The report also records how long it takes to import the agent modules in a fresh interpreter.
+
+# Caches are disabled or emptied for every decision, so each measurement is a cold decision on that position. The search agents run with the opening book off,
+# so every position measures a search; the `book` entry times the book lookup on its own (a miss on positions with more stones than the book covers).
+
+# With --instrument the agents' work counters (see instrument.py) are added to each agent's report as totals and per-decision averages, and --prometheus writes them
+# in Prometheus text format. --capture profiles the first timed decision of each agent with cProfile or tracemalloc and adds the report.
+
+# Examples:
+#   python bench.py --output bench.json
+#   python bench.py --agents mc mcts --repeats 20 --compare bench.json --max-regression 0.2
+#   python bench.py --agents sparse --instrument --capture cprofile --prometheus bench.prom
+
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import time
+from collections import Counter
+import numpy as np
+import instrument
+import seeding
+
+# Fixed corpus of positions with 'O' to move, as rows of the board
+CORPUS = {
+    'opening': [
+        ['   ', '   ', '   '],
+        ['X  ', '   ', '   '],
+        ['   ', ' X ', '   '],
+    ],
+    'midgame': [
+        ['X  ', ' O ', '  X'],
+        ['XX ', 'O  ', '   '],
+        ['X O', ' X ', '   '],
+    ],
+    'endgame': [
+        ['XOX', 'XO ', 'O X'],
+        ['XXO', 'OOX', 'X  '],
+        ['OX ', 'XXO', 'O X'],
+    ],
+}
+
+BENCH_SEED = 1234
+
+
+def parse_board(rows):
+    return [list(row) for row in rows]
+
+# Benchmarked decisions: each takes a list board and returns the work done as {'rollouts': n, 'nodes': n}
+def decide_mc(board, num_episodes=10000):
+    from monteclaro import monte_carlo_rollout
+    monte_carlo_rollout(board, num_episodes=num_episodes, table=None, book=False)
+    return {'rollouts': num_episodes * sum(row.count(' ') for row in board)}
+
+def decide_mcts(board, iterations=2000):
+    from engine import O, Position
+    from mcts import MCTSAgent
+    agent = MCTSAgent(iterations=iterations)
+    agent.select_move(Position.from_board(board, turn=O))
+    return {'rollouts': iterations, 'nodes': iterations}
+
+def decide_sparse(board):
+    from sparsesampling import sparse_sampling
+    cache = {}
+    sparse_sampling(board, cache=cache, book=False)
+    return {'nodes': len(cache)}
+
+def decide_book(board):
+    from engine import O, Position
+    from openingbook import book_move
+    book_move(Position.from_board(board, turn=O))
+    return {}
+
+def decide_td(board):
+    from engine import O, Position
+    from temporallearning import td_select
+    td_select(Position.from_board(board, turn=O), exploration_param=0)
+    return {}
+
+def decide_alphabeta(board):
+    from alphabeta import AlphaBetaAgent
+    from engine import O, Position
+    agent = AlphaBetaAgent()
+    agent.select_move(Position.from_board(board, turn=O))
+    return {'nodes': agent.nodes}
+
+def decide_optimal(board):
+    from solver import optimal_move
+    optimal_move(board)
+    return {}
+
+AGENTS = {
+    'mc': decide_mc,
+    'mcts': decide_mcts,
+    'sparse': decide_sparse,
+    'book': decide_book,
+    'td': decide_td,
+    'alphabeta': decide_alphabeta,
+    'optimal': decide_optimal,
+}
+
+
+# Time one agent over the corpus; runs in a child process
+def bench_agent(name, repeats, instrumented=False, capture=None):
+    seeding.seed(BENCH_SEED)
+    decide = AGENTS[name]
+    if instrumented or capture:
+        instrument.enable()
+    decide(parse_board(CORPUS['opening'][0]))  # warm up imports and tables
+    instrument.reset()
+    if capture:
+        instrument.capture_next(capture)
+
+    latencies = []
+    work = {'rollouts': 0, 'nodes': 0}
+    phases = {}
+    for phase, positions in CORPUS.items():
+        phase_latencies = []
+        for rows in positions:
+            for _ in range(repeats):
+                board = parse_board(rows)
+                start = time.perf_counter()
+                done = decide(board)
+                phase_latencies.append(time.perf_counter() - start)
+                for key, value in done.items():
+                    work[key] += value
+        phases[phase] = {'p50_ms': 1000 * float(np.percentile(phase_latencies, 50))}
+        latencies += phase_latencies
+
+    total = sum(latencies)
+    result = {
+        'decisions': len(latencies),
+        'p50_ms': 1000 * float(np.percentile(latencies, 50)),
+        'p99_ms': 1000 * float(np.percentile(latencies, 99)),
+        'mean_ms': 1000 * total / len(latencies),
+        'decisions_per_sec': len(latencies) / total,
+        'rollouts_per_sec': work['rollouts'] / total,
+        'nodes_per_sec': work['nodes'] / total,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'phases': phases,
+    }
+    if instrumented:
+        result['instrument'] = instrument.snapshot()
+    if instrument.last_capture is not None:
+        result['capture'] = instrument.last_capture['report']
+    return result
+
+# Seconds to import the agent modules in a fresh interpreter
+def import_seconds():
+    code = "import time; t = time.perf_counter(); import monteclaro, sparsesampling, temporallearning; print(time.perf_counter() - t)"
+    return float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout)
+
+def run(agents, repeats, instrumented=False, capture=None):
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for name in agents:
+        with context.Pool(1) as pool:
+            results[name] = pool.apply(bench_agent, (name, repeats, instrumented, capture))
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'repeats': repeats,
+        'import_seconds': import_seconds(),
+        'agents': results,
+    }
+
+# Compare p50 latency with a previous report; returns the agents that got slower than allowed
+def compare(report, baseline, max_regression):
+    regressions = []
+    for name, result in report['agents'].items():
+        if name not in baseline.get('agents', {}):
+            continue
+        before, after = baseline['agents'][name]['p50_ms'], result['p50_ms']
+        change = (after - before) / before if before else 0.0
+        print(f"{name:8s} p50 {before:9.3f} ms -> {after:9.3f} ms ({change:+.1%})")
+        if change > max_regression:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Tic-Tac-Toe agents")
+    parser.add_argument('--agents', nargs='+', default=list(AGENTS), choices=list(AGENTS))
+    parser.add_argument('--repeats', type=int, default=5, help="decisions per corpus position")
+    parser.add_argument('--output', help="write the JSON report to this file instead of stdout")
+    parser.add_argument('--compare', help="previous JSON report to compare p50 latency against")
+    parser.add_argument('--max-regression', type=float, default=0.2, help="allowed relative p50 slowdown with --compare")
+    parser.add_argument('--instrument', action='store_true', help="count the work of every decision (adds a little overhead to the timings)")
+    parser.add_argument('--capture', choices=('cprofile', 'tracemalloc'), help="profile the first timed decision of each agent")
+    parser.add_argument('--prometheus', help="with --instrument, also write the counters in Prometheus text format to this file")
+    args = parser.parse_args()
+
+    report = run(args.agents, args.repeats, args.instrument or bool(args.prometheus), args.capture)
+    if args.prometheus:
+        for result in report['agents'].values():
+            for agent, totals in result['instrument'].items():
+                instrument.totals.setdefault(agent, Counter()).update({name: value for name, value in totals.items() if name != 'per_decision'})
+        instrument.to_prometheus(args.prometheus)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(report, json.load(file), args.max_regression)
+        if regressions:
+            print(f"Slower than allowed: {', '.join(regressions)}")
+            sys.exit(1)
@@ -0,0 +1,147 @@
+"""
+Script Name: Bitboard Game-State Engine for Tic-Tac-Toe
+Description: This module holds a Tic-Tac-Toe position as a pair of 9-bit integers (one per player) and provides win detection, legal-move generation and make/unmake of moves shared by all the agents.
+Date: October 18, 2026
+"""
+
+# Cell `i` of the board is bit `i` of a player's integer, counted row by row (cell = row * BOARD_COLS + col).
+# The 8 winning lines are precomputed as bit masks, and a 512-entry table answers "does this set of stones contain a line?" with a single index.
+
+# Moves are applied and undone in place with bit operations, so search and rollouts never copy the board.
+
+# The agent modules (`monteclaro`, `sparsesampling`, `temporallearning`) convert their list boards with `Position.from_board` and use this engine for every hot-path operation.
+
+
+BOARD_ROWS, BOARD_COLS = 3, 3
+NUM_CELLS = BOARD_ROWS * BOARD_COLS
+FULL_MASK = (1 << NUM_CELLS) - 1
+
+# Players
+X, O = 0, 1
+SYMBOLS = ('X', 'O')
+
+# Winning lines as lists of cells
+WIN_LINES = (
+    [[row * BOARD_COLS + col for col in range(BOARD_COLS)] for row in range(BOARD_ROWS)]
+    + [[row * BOARD_COLS + col for row in range(BOARD_ROWS)] for col in range(BOARD_COLS)]
+    + [[i * BOARD_COLS + i for i in range(BOARD_ROWS)]]
+    + [[i * BOARD_COLS + BOARD_COLS - i - 1 for i in range(BOARD_ROWS)]]
+)
+
+# Winning lines as bit masks
+WIN_MASKS = tuple(sum(1 << cell for cell in line) for line in WIN_LINES)
+
+# WIN_TABLE[bits] is 1 if the stones in `bits` complete at least one line
+WIN_TABLE = bytes(int(any(bits & mask == mask for mask in WIN_MASKS)) for bits in range(1 << NUM_CELLS))
+
+# Base-3 encoding of a board (empty 0, X 1, O 2 in digit `cell`): TERNARY[bits] is the sum of 3 ** cell over the set bits
+NUM_STATES = 3 ** NUM_CELLS
+TERNARY = tuple(sum(3 ** cell for cell in range(NUM_CELLS) if bits >> cell & 1) for bits in range(1 << NUM_CELLS))
+
+
+# Check whether a player's stones complete a line
+def has_won(bits):
+    return WIN_TABLE[bits]
+
+# Iterate over the cells set in a bit mask, lowest first
+def iter_bits(bits):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+# Convert between cell indices and (row, col) moves
+def cell_to_move(cell):
+    return divmod(cell, BOARD_COLS)
+
+def move_to_cell(move):
+    return move[0] * BOARD_COLS + move[1]
+
+# Build the bit mask of one player's stones on a list board
+def board_bits(board, player):
+    symbol = SYMBOLS[player] if isinstance(player, int) else player
+    bits = 0
+    for row in range(BOARD_ROWS):
+        for col in range(BOARD_COLS):
+            if board[row][col] == symbol:
+                bits |= 1 << (row * BOARD_COLS + col)
+    return bits
+
+
+# A mutable position: bits[X], bits[O] and the player to move
+class Position:
+    __slots__ = ('bits', 'turn')
+
+    def __init__(self, x_bits=0, o_bits=0, turn=X):
+        self.bits = [x_bits, o_bits]
+        self.turn = turn
+
+    # Build a position from a list board with `turn` to move
+    @classmethod
+    def from_board(cls, board, turn=O):
+        return cls(board_bits(board, X), board_bits(board, O), turn)
+
+    # Convert back to the list board used by the game loops
+    def to_board(self):
+        board = [[' ' for _ in range(BOARD_COLS)] for _ in range(BOARD_ROWS)]
+        for player in (X, O):
+            for cell in iter_bits(self.bits[player]):
+                row, col = cell_to_move(cell)
+                board[row][col] = SYMBOLS[player]
+        return board
+
+    def copy(self):
+        return Position(self.bits[X], self.bits[O], self.turn)
+
+    # The same position with the colours of the stones and the player to move swapped
+    def swapped(self):
+        return Position(self.bits[O], self.bits[X], self.turn ^ 1)
+
+    # Bit mask of empty cells
+    def empty(self):
+        return FULL_MASK & ~(self.bits[X] | self.bits[O])
+
+    def legal_moves(self):
+        return list(iter_bits(self.empty()))
+
+    # Place a stone for the player to move and pass the turn
+    def play(self, cell):
+        self.bits[self.turn] |= 1 << cell
+        self.turn ^= 1
+
+    # Take back a stone placed by `play`
+    def undo(self, cell):
+        self.turn ^= 1
+        self.bits[self.turn] &= ~(1 << cell)
+
+    # Return X or O if that player has a line, otherwise None
+    def winner(self):
+        if WIN_TABLE[self.bits[X]]:
+            return X
+        if WIN_TABLE[self.bits[O]]:
+            return O
+        return None
+
+    def is_full(self):
+        return (self.bits[X] | self.bits[O]) == FULL_MASK
+
+    def is_terminal(self):
+        return self.is_full() or WIN_TABLE[self.bits[X]] or WIN_TABLE[self.bits[O]]
+
+    # Base-3 index of the stones on the board (the player to move is not included)
+    def index(self):
+        return TERNARY[self.bits[X]] + 2 * TERNARY[self.bits[O]]
+
+    # Hashable key for the position including the player to move
+    def key(self):
+        return (self.bits[X], self.bits[O], self.turn)
+
+    def __eq__(self, other):
+        return isinstance(other, Position) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        rows = [''.join(row).replace(' ', '.') for row in self.to_board()]
+        return f"Position({'/'.join(rows)}, turn={SYMBOLS[self.turn]})"
@@ -0,0 +1,169 @@
+"""
+Script Name: Compact Binary Game Records for Tic-Tac-Toe
+Description: This module streams finished games to an append-only file of fixed 8-byte records and reads them back with generators that replay, filter and aggregate millions of games without loading the file.
+Date: October 18, 2026
+"""
+
+# Record layout (8 bytes per game):
+#   bytes 0-4  the cells played, one 4-bit nibble per move in order (low nibble first), 0xF after the last move
+#   byte 5     bits 0-3 number of moves, bits 4-5 result (0 draw, 1 X won, 2 O won, the batch simulator cell values), bit 6 set if O moved first
+#   byte 6     agent ID of the X player
+#   byte 7     agent ID of the O player
+# Agent IDs index AGENT_NAMES; new agents are only ever appended so old files keep their meaning. Unknown names are stored as 255.
+
+# The writer opens the file unbuffered in append mode, so every record is a single 8-byte write: records from several processes appending to the same file never interleave,
+# and a game is on disk as soon as it finishes. A partial record left by a crash is ignored by the reader.
+
+# The reader yields NumPy chunks of records (`read_chunks`) or one `GameRecord` per game (`read_games`); `aggregate` counts results per pairing chunk by chunk with array operations.
+
+# Examples:
+#   python selfplay.py mcts random --games 100000 --log games.bin
+#   python gamelog.py games.bin
+#   python gamelog.py games.bin --show 5 --agent mcts
+
+
+import argparse
+from collections import namedtuple
+import numpy as np
+from engine import NUM_CELLS, O, X, Position
+
+RECORD_DTYPE = np.dtype([('moves', np.uint8, (5,)), ('info', np.uint8), ('agent_x', np.uint8), ('agent_o', np.uint8)])
+RECORD_SIZE = RECORD_DTYPE.itemsize
+CHUNK_RECORDS = 1 << 16
+
+AGENT_NAMES = ('human', 'random', 'optimal', 'mc', 'mcts', 'sparse', 'td', 'alphabeta')
+UNKNOWN_AGENT = 255
+
+# Result codes
+DRAW, X_WON, O_WON = 0, 1, 2
+
+GameRecord = namedtuple('GameRecord', ['moves', 'winner', 'first', 'agent_x', 'agent_o'])
+
+
+def agent_id(name):
+    return AGENT_NAMES.index(name) if name in AGENT_NAMES else UNKNOWN_AGENT
+
+def agent_name(identifier):
+    return AGENT_NAMES[identifier] if identifier < len(AGENT_NAMES) else 'unknown'
+
+# Pack one game into its 8-byte record; `winner` is X, O or None
+def pack(moves, winner, agent_x, agent_o, first=X):
+    if len(moves) > NUM_CELLS:
+        raise ValueError(f"a game has at most {NUM_CELLS} moves")
+    nibbles = list(moves) + [0xF] * (10 - len(moves))
+    packed = bytes(nibbles[i] | nibbles[i + 1] << 4 for i in range(0, 10, 2))
+    result = DRAW if winner is None else winner + 1
+    info = len(moves) | result << 4 | (first == O) << 6
+    return packed + bytes((info, agent_id(agent_x), agent_id(agent_o)))
+
+# Unpack one record (a row of a chunk from `read_chunks`)
+def unpack(record):
+    info = int(record['info'])
+    nibbles = [nibble for byte in record['moves'].tolist() for nibble in (byte & 0xF, byte >> 4)]
+    result = info >> 4 & 3
+    return GameRecord(moves=tuple(nibbles[:info & 0xF]), winner=None if result == DRAW else result - 1,
+                      first=O if info >> 6 & 1 else X,
+                      agent_x=agent_name(int(record['agent_x'])), agent_o=agent_name(int(record['agent_o'])))
+
+# Moves of a whole chunk as an (N, 9) int8 array, -1 after the last move
+def chunk_moves(chunk):
+    nibbles = np.stack([chunk['moves'] & 0xF, chunk['moves'] >> 4], axis=2).reshape(len(chunk), 10)[:, :NUM_CELLS]
+    moves = nibbles.astype(np.int8)
+    moves[np.arange(NUM_CELLS) >= (chunk['info'] & 0xF)[:, None]] = -1
+    return moves
+
+
+# Append-only writer
+class GameLog:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'ab', buffering=0)
+
+    def write(self, moves, winner, agent_x, agent_o, first=X):
+        self.file.write(pack(moves, winner, agent_x, agent_o, first))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Yield the records of a file as structured arrays of up to `chunk_records` games
+def read_chunks(path, chunk_records=CHUNK_RECORDS):
+    with open(path, 'rb') as file:
+        while True:
+            data = file.read(chunk_records * RECORD_SIZE)
+            complete = len(data) // RECORD_SIZE
+            if complete:
+                yield np.frombuffer(data, dtype=RECORD_DTYPE, count=complete)
+            if len(data) < chunk_records * RECORD_SIZE:
+                return
+
+# Yield one GameRecord per game
+def read_games(path, chunk_records=CHUNK_RECORDS):
+    for chunk in read_chunks(path, chunk_records):
+        for record in chunk:
+            yield unpack(record)
+
+# Yield the games involving `agent` (on either side, or as `side` X / O) and, if given, with the given winner ('X', 'O' or 'draw')
+def filter_games(path, agent=None, side=None, winner=None, chunk_records=CHUNK_RECORDS):
+    result = {'draw': DRAW, 'X': X_WON, 'O': O_WON}.get(winner)
+    for chunk in read_chunks(path, chunk_records):
+        keep = np.ones(len(chunk), dtype=bool)
+        if agent is not None:
+            identifier = agent_id(agent)
+            x_match, o_match = chunk['agent_x'] == identifier, chunk['agent_o'] == identifier
+            keep &= x_match if side == 'X' else o_match if side == 'O' else x_match | o_match
+        if result is not None:
+            keep &= (chunk['info'] >> 4 & 3) == result
+        for record in chunk[keep]:
+            yield unpack(record)
+
+# Positions after each move of a game, starting from the empty board
+def replay(game):
+    position = Position(turn=game.first)
+    yield position.copy()
+    for cell in game.moves:
+        position.play(cell)
+        yield position.copy()
+
+# Count games, results and moves per (X agent, O agent) pairing
+def aggregate(path, chunk_records=CHUNK_RECORDS):
+    counts = np.zeros((256, 256, 3), dtype=np.int64)
+    moves = np.zeros((256, 256), dtype=np.int64)
+    for chunk in read_chunks(path, chunk_records):
+        np.add.at(counts, (chunk['agent_x'], chunk['agent_o'], chunk['info'] >> 4 & 3), 1)
+        np.add.at(moves, (chunk['agent_x'], chunk['agent_o']), chunk['info'] & 0xF)
+    summary = {}
+    for agent_x, agent_o in zip(*np.nonzero(counts.sum(axis=2))):
+        draws, x_wins, o_wins = counts[agent_x, agent_o].tolist()
+        games = draws + x_wins + o_wins
+        summary[(agent_name(agent_x), agent_name(agent_o))] = {
+            'games': games, 'x_wins': x_wins, 'o_wins': o_wins, 'draws': draws,
+            'mean_moves': moves[agent_x, agent_o] / games,
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize or print a Tic-Tac-Toe game log")
+    parser.add_argument('path')
+    parser.add_argument('--show', type=int, default=0, metavar='N', help="print the first N matching games")
+    parser.add_argument('--agent', choices=AGENT_NAMES, help="only games played by this agent")
+    parser.add_argument('--winner', choices=('X', 'O', 'draw'))
+    args = parser.parse_args()
+
+    if args.show:
+        for number, game in enumerate(filter_games(args.path, args.agent, winner=args.winner)):
+            if number == args.show:
+                break
+            result = 'draw' if game.winner is None else f"{'XO'[game.winner]} wins"
+            print(f"{game.agent_x} (X) vs {game.agent_o} (O): {' '.join(map(str, game.moves))} - {result}")
+    else:
+        for (agent_x, agent_o), stats in sorted(aggregate(args.path).items()):
+            print(f"{agent_x} (X) vs {agent_o} (O): {stats['games']} games, X wins {stats['x_wins']}, "
+                  f"O wins {stats['o_wins']}, draws {stats['draws']}, {stats['mean_moves']:.2f} moves per game")
@@ -0,0 +1,176 @@
+"""
+Script Name: Hot-Path Instrumentation for the Tic-Tac-Toe Agents
+Description: This module counts the work each agent does per decision (rollouts, nodes expanded, cache hits and misses, win checks, allocations), times the decisions, captures cProfile or tracemalloc data for a single decision, and exports the totals as JSON or Prometheus text.
+Date: October 18, 2026
+"""
+
+# Instrumentation is off unless the TICTACTOE_INSTRUMENT environment variable is set to 1, or `enable()` is called.
+# When it is off, a decorated agent function costs one flag test per decision and `count` returns at once; the hot loops never call into this module,
+# they keep plain local tallies and report them with one `count` call per search or per simulation step.
+
+# Agent entry points are wrapped with `@decision('name')`. A decision inside another (for example `mcts_search` calling `MCTSAgent.select_move`) is folded into the outer one.
+# Counts made during a decision are added to that agent's totals, together with the number of decisions and their total and slowest time.
+
+# `capture_next('cprofile')` or `capture_next('tracemalloc')` profiles the next decision only (TICTACTOE_CAPTURE does the same for the first instrumented decision of the process);
+# the report is kept in `last_capture` and written to `path` if one was given.
+
+# Counter names used by the agents:
+#   rollouts         random playouts simulated
+#   nodes_expanded   search nodes created (MCTS) or subtree values computed (sparse sampling)
+#   cache_hits, cache_misses   transposition table lookups
+#   win_checks       win tests on a board
+#   position_copies  search positions copied
+#   array_bytes      bytes of NumPy playout boards allocated
+#   value_lookups    value or solver table reads
+
+# `bench.py --instrument` reports these counters per decision for every benchmarked agent.
+
+
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from collections import Counter
+
+enabled = os.environ.get('TICTACTOE_INSTRUMENT', '') not in ('', '0')
+capture_kind = os.environ.get('TICTACTOE_CAPTURE') or None
+capture_path = None
+last_capture = None
+
+# Agent name -> Counter with 'decisions', 'seconds', 'max_seconds' and the work counters
+totals = {}
+
+# Counter of the decision in progress, None outside a decision
+_active = None
+
+
+def enable():
+    global enabled
+    enabled = True
+
+def disable():
+    global enabled
+    enabled = False
+
+def reset():
+    global last_capture
+    totals.clear()
+    last_capture = None
+
+# Add `amount` to counter `name` of the decision in progress
+def count(name, amount=1):
+    if enabled and _active is not None:
+        _active[name] += amount
+
+# Profile the next decision with 'cprofile' or 'tracemalloc'
+def capture_next(kind='cprofile', path=None):
+    global capture_kind, capture_path
+    if kind not in ('cprofile', 'tracemalloc'):
+        raise ValueError(f"unknown capture kind {kind!r}")
+    capture_kind, capture_path = kind, path
+
+# Run `function` under the armed capture and keep the report
+def _captured(agent, function, args, kwargs):
+    global capture_kind, capture_path, last_capture
+    kind, path = capture_kind, capture_path
+    capture_kind = capture_path = None
+
+    if kind == 'cprofile':
+        profiler = cProfile.Profile()
+        result = profiler.runcall(function, *args, **kwargs)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(25)
+        report = text.getvalue()
+        if path:
+            profiler.dump_stats(path)
+    else:
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        result = function(*args, **kwargs)
+        after = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        if not tracing:
+            tracemalloc.stop()
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        differences = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+        _active['allocated_blocks'] += sum(max(0, stat.count_diff) for stat in differences)
+        _active['peak_bytes'] += peak
+        report = '\n'.join([f"Peak traced memory: {peak} bytes"] + [str(stat) for stat in differences[:25]])
+        if path:
+            with open(path, 'w') as file:
+                file.write(report + '\n')
+
+    last_capture = {'agent': agent, 'kind': kind, 'report': report}
+    return result
+
+# Decorator that records each call of an agent function as one decision of `agent`
+def decision(agent):
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            global _active
+            if not enabled or _active is not None:
+                return function(*args, **kwargs)
+            _active = Counter()
+            start = time.perf_counter()
+            try:
+                if capture_kind is not None:
+                    return _captured(agent, function, args, kwargs)
+                return function(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - start
+                agent_totals = totals.setdefault(agent, Counter())
+                agent_totals.update(_active)
+                agent_totals['decisions'] += 1
+                agent_totals['seconds'] += seconds
+                agent_totals['max_seconds'] = max(agent_totals['max_seconds'], seconds)
+                _active = None
+        return wrapper
+    return decorate
+
+
+# Totals per agent with per-decision averages
+def snapshot():
+    report = {}
+    for agent, agent_totals in totals.items():
+        decisions = agent_totals['decisions']
+        entry = dict(agent_totals)
+        entry['per_decision'] = {name: value / decisions for name, value in agent_totals.items()
+                                 if name not in ('decisions', 'max_seconds')}
+        report[agent] = entry
+    return report
+
+def to_json(path=None):
+    text = json.dumps(snapshot(), indent=2, sort_keys=True)
+    if path:
+        with open(path, 'w') as file:
+            file.write(text + '\n')
+    return text
+
+PROMETHEUS_NAMES = {'seconds': 'tictactoe_decision_seconds_total', 'max_seconds': 'tictactoe_decision_seconds_max'}
+
+# Prometheus text exposition format: one counter per name, labelled by agent
+def to_prometheus(path=None):
+    names = sorted({name for agent_totals in totals.values() for name in agent_totals})
+    lines = []
+    for name in names:
+        metric = PROMETHEUS_NAMES.get(name, f'tictactoe_{name}_total')
+        lines.append(f'# TYPE {metric} {"gauge" if name == "max_seconds" else "counter"}')
+        for agent in sorted(totals):
+            if name in totals[agent]:
+                lines.append(f'{metric}{{agent="{agent}"}} {totals[agent][name]}')
+    text = '\n'.join(lines) + '\n'
+    if path:
+        # Write then rename, so a collector reading the file never sees half of it
+        with open(path + '.tmp', 'w') as file:
+            file.write(text)
+        os.replace(path + '.tmp', path)
+    return text
+
@@ -0,0 +1,129 @@
+"""
+Script Name: Linear Value Function over Line Features for Temporal Difference Learning
+Description: This module approximates state values as a weighted sum of line features, computed for whole batches of positions with NumPy, so TD learning works on boards far too large for a value table.
+Date: October 18, 2026
+"""
+
+# A window is any k cells in a row on the board, horizontal, vertical or diagonal: every line a player could still complete (the 8 win lines on 3x3).
+# A window is open for a player when it holds none of the opponent's stones. The features of a position are, for each player and each c from 1 to k,
+# the number of open windows holding exactly c of the player's stones (open ones, twos, threes, ...); the same counts again for the player to move only,
+# so that a threat is worth more when its owner moves next; and a constant 1. That is 4k + 1 weights for any board size, and evaluating a position
+# costs one pass over its windows, however many states the game has.
+
+# The value of a position is the dot product of its features and the weights, an estimate of the outcome for 'O' (1 win, 0 draw, -1 loss), like `ValueTable`.
+# `LinearValue` has the interface of `ValueTable`: `state_id` returns the feature vector, which is the state the TD updates take.
+# The updates are normalized (the step is divided by the squared length of the feature vector), so that a learning rate means the same on every board size.
+
+# `features` works on an (N, cells) int8 array in the batch simulator encoding (0 empty, 1 X, 2 O): one gather of the window cells, two comparisons and two sums.
+# Weights are updated in place and saved as a float32 `.npy` file; `load(mmap=True)` maps it read-only, so processes that only play share one copy of it.
+
+
+import os
+import numpy as np
+from batchsim import EMPTY, O_CELL, PLAYER_CELLS, X_CELL, encode
+from engine import O, X, Position
+from mnk import DIRECTIONS
+
+LINEAR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'td_linear.npy')
+
+
+# Cell indices of every k-in-a-row window on a rows x cols board, as a (windows, k) array
+def windows(rows, cols, k):
+    lines = []
+    for row in range(rows):
+        for col in range(cols):
+            for dr, dc in DIRECTIONS:
+                if 0 <= row + (k - 1) * dr < rows and 0 <= col + (k - 1) * dc < cols:
+                    lines.append([(row + i * dr) * cols + col + i * dc for i in range(k)])
+    return np.array(lines, dtype=np.intp).reshape(-1, k)
+
+# Board row of an engine Position or an MNKBoard in the batch simulator encoding
+def encode_state(state):
+    if isinstance(state, Position):
+        return encode(state)
+    return np.frombuffer(state.cells, dtype=np.uint8).astype(np.int8)
+
+
+class LinearValue:
+    def __init__(self, weights=None, rows=3, cols=3, k=3):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.windows = windows(rows, cols, k)
+        self.counts = np.arange(1, k + 1)
+        self.weights = weights if weights is not None else np.zeros(4 * k + 1, dtype=np.float32)
+
+    # Features of a batch: `boards` is (N, cells) int8 and `turns` the player to move on each board; returns (N, 4k + 1) float32
+    def features(self, boards, turns):
+        cells = boards[:, self.windows]
+        x_stones = (cells == X_CELL).sum(axis=2)
+        o_stones = (cells == O_CELL).sum(axis=2)
+        # Stones in each open window (0 when the window is blocked), then the number of windows with each count
+        x_open = np.where(o_stones == 0, x_stones, 0)
+        o_open = np.where(x_stones == 0, o_stones, 0)
+        x_counts = (x_open[:, :, None] == self.counts).sum(axis=1)
+        o_counts = (o_open[:, :, None] == self.counts).sum(axis=1)
+        turns = np.asarray(turns)[:, None]
+        k = self.k
+        features = np.empty((len(boards), 4 * k + 1), dtype=np.float32)
+        features[:, :k] = x_counts
+        features[:, k:2 * k] = o_counts
+        features[:, 2 * k:3 * k] = x_counts * (turns == X)
+        features[:, 3 * k:4 * k] = o_counts * (turns == O)
+        features[:, -1] = 1.0
+        return features
+
+    # Values of a batch of boards
+    def batch_values(self, boards, turns):
+        return self.features(boards, turns) @ self.weights
+
+    # Feature vector of a position: the state handed to the TD updates
+    def state_id(self, position):
+        return self.features(encode_state(position)[None, :], [position.turn])[0]
+
+    def value(self, position):
+        return float(self.state_id(position) @ self.weights)
+
+    # Values of the afterstates of the player to move playing each of `moves`, evaluated as one batch:
+    # the reward where the move completes a line (1 for 'O', -1 for 'X'), 0 where it fills the board, otherwise the estimate
+    def afterstate_values(self, position, moves):
+        stone = PLAYER_CELLS[position.turn]
+        boards = np.repeat(encode_state(position)[None, :], len(moves), axis=0)
+        boards[np.arange(len(moves)), moves] = stone
+        values = self.batch_values(boards, np.full(len(moves), position.turn ^ 1))
+        won = (boards[:, self.windows] == stone).all(axis=2).any(axis=1)
+        full = (boards != EMPTY).all(axis=1)
+        return np.where(won, 1.0 if stone == O_CELL else -1.0, np.where(full, 0.0, values)).tolist()
+
+    # TD(0): move the value of the state with features `state` towards `target`, return the TD error
+    def td0_update(self, state, target, learning_rate=0.1):
+        delta = target - float(state @ self.weights)
+        self.weights += (learning_rate * delta / float(state @ state)) * state
+        return delta
+
+    # TD(lambda) over one episode: `states` are the feature vectors in visiting order and `reward` is the final outcome
+    def td_lambda_update(self, states, reward, learning_rate=0.1, discount_factor=0.9, trace_decay=0.8):
+        if not len(states):
+            return
+        states = np.asarray(states, dtype=np.float32)
+        step_sizes = learning_rate / np.einsum('ij,ij->i', states, states)
+        traces = np.zeros(states.shape[1], dtype=np.float32)
+        for t in range(len(states)):
+            if t + 1 < len(states):
+                target = discount_factor * float(states[t + 1] @ self.weights)
+            else:
+                target = reward
+            delta = target - float(states[t] @ self.weights)
+            traces *= discount_factor * trace_decay
+            traces += states[t]
+            self.weights += (step_sizes[t] * delta) * traces
+
+    def save(self, path=LINEAR_PATH):
+        np.save(path, np.asarray(self.weights, dtype=np.float32))
+
+    # Load saved weights, or start from zero if the file does not exist; with `mmap` the file is mapped read-only instead of read
+    @classmethod
+    def load(cls, path=LINEAR_PATH, rows=3, cols=3, k=3, mmap=False):
+        if os.path.exists(path):
+            weights = np.load(path, mmap_mode='r' if mmap else None)
+            if weights.shape == (4 * k + 1,):
+                return cls(weights if mmap else weights.astype(np.float32, copy=False), rows, cols, k)
+        return cls(rows=rows, cols=cols, k=k)
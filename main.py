@@ -5,39 +5,68 @@ Author: Vaishnavi Chowdary Kommi
 Date: April 26, 2024
 """
 
-# This script imports and runs main functions from separate modules implementing each algorithm:
+# This script compares the algorithms implemented in separate modules:
 # Monte Carlo algorithm: `monteclaro`
 # Sparse Sampling algorithm: `sparsesampling`
 # Temporal Difference Learning algorithm: `temporallearning`
 
-# The efficiency values of each algorithm are collected and plotted to visualize their performance over a series of games. The plot demonstrates the efficiency comparison among the algorithms in strategic decision-making during Tic-Tac-Toe gameplay.
+# By default each algorithm plays headless games against a reference opponent (the random agent unless --opponent is given), alternating colours,
+# and the comparison shows what was measured in those games (see `metrics.py`): win rate with its 95% confidence interval, regret per move against perfect play
+# and decisions per second.
+
+# With --interactive the script runs each algorithm's own main function instead, where a human plays X, and plots their efficiency over those games.
 
 # To use this script:
 # 1. Ensure that the required modules (`monteclaro`, `sparsesampling`, `temporallearning`) are installed.
-# 2. Run the script to execute each algorithm's main function and generate an efficiency comparison plot.
+# 2. Run the script to play the comparison games and generate the comparison plot, e.g. `python main.py --games 2000 --opponent optimal`.
 
 # Note: This script requires `matplotlib` for plotting. Make sure the necessary dependencies are installed before running the script.
 
 
 
-import matplotlib.pyplot as plt
-from monteclaro import main as monte_carlo_main
-from sparsesampling import main as sparse_main
-from temporallearning import main as temporal_main
-
-# Run each algorithm and collect efficiency values
-monte_carlo_efficiency = monte_carlo_main()
-sparse_efficiency = sparse_main()
-temporal_efficiency = temporal_main()
-
-# Plot efficiency values
-games = min(len(monte_carlo_efficiency), len(sparse_efficiency), len(temporal_efficiency))
-plt.plot(range(1, games + 1), monte_carlo_efficiency[:games], marker='o', label='Monte Carlo')
-plt.plot(range(1, games + 1), sparse_efficiency[:games], marker='o', label='Sparse Sampling')
-plt.plot(range(1, games + 1), temporal_efficiency[:games], marker='o', label='Temporal Difference Learning')
-plt.title('Efficiency Comparison of Algorithms over 5 Games')
-plt.xlabel('Game Number')
-plt.ylabel('Efficiency')
-plt.legend()
-plt.grid(True)
-plt.show()
+import argparse
+from metrics import evaluate_agent
+
+ALGORITHMS = {
+    'Monte Carlo': 'mc',
+    'Sparse Sampling': 'sparse',
+    'Temporal Difference Learning': 'td',
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the Tic-Tac-Toe algorithms")
+    parser.add_argument('--games', type=int, default=1000, help="games per algorithm")
+    parser.add_argument('--opponent', default='random', help="agent the algorithms play against")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--interactive', action='store_true', help="play the algorithms yourself instead")
+    args = parser.parse_args()
+
+    if args.interactive:
+        from monteclaro import main as monte_carlo_main
+        from sparsesampling import main as sparse_main
+        from temporallearning import main as temporal_main
+        from ui import plot_comparison
+
+        # Run each algorithm and collect efficiency values
+        monte_carlo_efficiency = monte_carlo_main()
+        sparse_efficiency = sparse_main()
+        temporal_efficiency = temporal_main()
+
+        # Plot efficiency values
+        plot_comparison({
+            'Monte Carlo': monte_carlo_efficiency,
+            'Sparse Sampling': sparse_efficiency,
+            'Temporal Difference Learning': temporal_efficiency,
+        })
+    else:
+        from ui import plot_metrics
+
+        # Play each algorithm against the opponent and measure it
+        results = {}
+        for label, name in ALGORITHMS.items():
+            results[label] = evaluate_agent(name, args.opponent, args.games, args.workers, args.seed)
+            print(results[label].report(f"{label} vs {args.opponent}"))
+
+        # Plot the measured strength and cost
+        plot_metrics(results, args.opponent)
@@ -0,0 +1,134 @@
+"""
+Script Name: Monte Carlo Tree Search (UCT) for Tic-Tac-Toe
+Description: This module implements a UCB1/UCT Monte Carlo tree search agent that keeps its search tree between moves.
+Date: October 18, 2026
+"""
+
+# Each iteration walks down the tree choosing the child with the best UCB1 score, expands one untried move, plays a random game to the end from there and backs the result up the path.
+# `exploration_param` is the UCT exploration constant; the search stops after `iterations` iterations or when `time_budget` seconds have passed, whichever is set.
+
+# After a move is chosen the tree is kept. On the next call the agent looks for the opponent's reply among the grandchildren of the old root and continues from that subtree, so the statistics gathered for the expected line of play are reused.
+
+# The search works on any game object with the engine Position interface (`legal_moves`, `play`, `undo`, `winner`, `is_full`, `copy`, `key`, `turn`).
+
+
+import math
+import time
+from agents import Agent
+from instrument import count, decision
+from seeding import scalar_random
+
+
+# Search tree node; `player` is the side that made `move`
+class Node:
+    __slots__ = ('move', 'parent', 'children', 'untried', 'visits', 'value', 'player', 'key')
+
+    def __init__(self, position, move=None, parent=None):
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.untried = [] if position.winner() is not None or position.is_full() else position.legal_moves()
+        self.visits = 0
+        self.value = 0.0
+        self.player = position.turn ^ 1
+        self.key = position.key()
+
+    # UCB1 child selection
+    def best_child(self, exploration_param):
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.value / child.visits
+                   + exploration_param * math.sqrt(log_visits / child.visits))
+
+
+class MCTSAgent(Agent):
+    def __init__(self, exploration_param=1.4, iterations=2000, time_budget=None, rng=None):
+        self.exploration_param = exploration_param
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.rng = scalar_random(rng) if rng is not None else None
+        self.root = None
+
+    # Forget the kept tree, e.g. at the start of a new game
+    def reset(self):
+        self.root = None
+
+    # Find the node for `position` in the kept tree: the root itself, or one or two plies below it
+    def _reuse(self, position):
+        key = position.key()
+        if self.root is not None:
+            candidates = [self.root] + self.root.children
+            candidates += [grandchild for child in self.root.children for grandchild in child.children]
+            for node in candidates:
+                if node.key == key:
+                    node.parent = None
+                    return node
+        return Node(position)
+
+    # Play uniformly random moves to the end of the game and return the winner (None for a draw)
+    # Returns the winner and the number of win checks made
+    def _rollout(self, position):
+        winner = position.winner()
+        checks = 1
+        while winner is None and not position.is_full():
+            moves = position.legal_moves()
+            position.play(moves[self.rng.randrange(len(moves))])
+            winner = position.winner()
+            checks += 1
+        return winner, checks
+
+    # Run the search from `position` and return the most visited move; a `budget` (seconds) replaces `iterations` and `time_budget` for this call
+    # `rng` (a numpy Generator) restarts the agent's random stream; otherwise it continues the stream of earlier calls
+    @decision('mcts')
+    def select_move(self, position, budget=None, rng=None):
+        if position.is_terminal():
+            raise ValueError("the game is already over")
+        if rng is not None or self.rng is None:
+            self.rng = scalar_random(rng)
+        root = self._reuse(position)
+        time_budget = budget if budget is not None else self.time_budget
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        iteration = expanded = win_checks = 0
+
+        while True:
+            if deadline is not None:
+                if time.perf_counter() >= deadline and root.children:
+                    break
+            elif iteration >= self.iterations:
+                break
+            iteration += 1
+
+            node, state = root, position.copy()
+
+            # Selection
+            while not node.untried and node.children:
+                node = node.best_child(self.exploration_param)
+                state.play(node.move)
+
+            # Expansion
+            if node.untried:
+                move = node.untried.pop(self.rng.randrange(len(node.untried)))
+                state.play(move)
+                child = Node(state, move, node)
+                node.children.append(child)
+                node = child
+                expanded += 1
+
+            # Simulation
+            winner, checks = self._rollout(state)
+            win_checks += checks
+
+            # Backpropagation
+            while node is not None:
+                node.visits += 1
+                if winner is None:
+                    node.value += 0.5
+                elif winner == node.player:
+                    node.value += 1.0
+                node = node.parent
+
+        count('rollouts', iteration)
+        count('position_copies', iteration)
+        count('nodes_expanded', expanded)
+        count('win_checks', win_checks + expanded)
+        self.root = root
+        return max(root.children, key=lambda child: child.visits).move
@@ -0,0 +1,169 @@
+"""
+Script Name: Evaluation Metrics for the Tic-Tac-Toe Agents
+Description: This module measures agents on games they actually played: win/draw/loss rates with confidence intervals, cumulative regret against perfect play, average reward per episode and decisions per second, all accumulated in constant memory.
+Date: October 18, 2026
+"""
+
+# `GameMetrics` is updated once per finished game and keeps only running counts and sums (Welford's algorithm for the reward variance),
+# so it can follow a self-play run of any length. Two accumulators can be merged, which is how results from worker processes are combined.
+
+# Rates come with 95% Wilson score intervals, which stay inside [0, 1] and behave well for small samples and rates near 0 or 1.
+# Regret is measured per move with `solver.move_regret` (0 for a move that keeps the game-theoretic value, up to 2 for turning a win into a loss)
+# and summed over the agent's moves; rewards are 1 for a win, 0 for a draw and -1 for a loss.
+
+# `evaluate_agent` plays an agent against an opponent without a display, across worker processes, timing every decision of the agent.
+
+# Examples:
+#   python metrics.py mcts --opponent random --games 2000
+#   python metrics.py sparse td --opponent optimal --games 500
+
+
+import argparse
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+Z_95 = 1.959963984540054
+
+
+# Wilson score interval for `successes` out of `trials`
+def wilson_interval(successes, trials, z=Z_95):
+    if trials == 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (rate + z * z / (2 * trials)) / denominator
+    half_width = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+class GameMetrics:
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.reward_mean = 0.0
+        self.reward_m2 = 0.0
+        self.regret = 0.0
+        self.decisions = 0
+        self.decision_seconds = 0.0
+
+    # Record one finished game: `reward` 1/0/-1 for the agent, the summed regret of its moves and the seconds each of its decisions took
+    def update(self, reward, regret=0.0, decision_times=()):
+        self.games += 1
+        if reward > 0:
+            self.wins += 1
+        elif reward < 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+        delta = reward - self.reward_mean
+        self.reward_mean += delta / self.games
+        self.reward_m2 += delta * (reward - self.reward_mean)
+        self.regret += regret
+        self.decisions += len(decision_times)
+        self.decision_seconds += sum(decision_times)
+
+    # Combine with the metrics of another set of games
+    def merge(self, other):
+        games = self.games + other.games
+        if games:
+            delta = other.reward_mean - self.reward_mean
+            self.reward_m2 += other.reward_m2 + delta * delta * self.games * other.games / games
+            self.reward_mean += delta * other.games / games
+        self.games = games
+        self.wins += other.wins
+        self.draws += other.draws
+        self.losses += other.losses
+        self.regret += other.regret
+        self.decisions += other.decisions
+        self.decision_seconds += other.decision_seconds
+        return self
+
+    def reward_interval(self, z=Z_95):
+        if self.games < 2:
+            return -1.0, 1.0
+        half_width = z * math.sqrt(self.reward_m2 / (self.games - 1) / self.games)
+        return self.reward_mean - half_width, self.reward_mean + half_width
+
+    def decisions_per_second(self):
+        return self.decisions / self.decision_seconds if self.decision_seconds else 0.0
+
+    def summary(self):
+        games = max(self.games, 1)
+        return {
+            'No. of Episodes': self.games,
+            'Win Rate': self.wins / games,
+            'Win Rate CI': wilson_interval(self.wins, self.games),
+            'Draw Rate': self.draws / games,
+            'Draw Rate CI': wilson_interval(self.draws, self.games),
+            'Loss Rate': self.losses / games,
+            'Loss Rate CI': wilson_interval(self.losses, self.games),
+            'Regret': self.regret,
+            'Regret per Move': self.regret / self.decisions if self.decisions else 0.0,
+            'Average Total Rewards per Episode': self.reward_mean,
+            'Reward CI': self.reward_interval(),
+            'Efficiency': self.decisions_per_second(),
+        }
+
+    def report(self, label):
+        summary = self.summary()
+        low, high = summary['Win Rate CI']
+        reward_low, reward_high = summary['Reward CI']
+        return (f"{label}: {self.games} games, win {summary['Win Rate']:.1%} [{low:.1%}, {high:.1%}], "
+                f"draw {summary['Draw Rate']:.1%}, loss {summary['Loss Rate']:.1%}, "
+                f"reward {self.reward_mean:+.3f} [{reward_low:+.3f}, {reward_high:+.3f}], "
+                f"regret {self.regret:.0f} ({summary['Regret per Move']:.3f} per move), "
+                f"{summary['Efficiency']:.0f} decisions/s")
+
+
+# Worker: play `games` games of `name` against `opponent_name`, alternating colours, and measure `name`
+def evaluate_chunk(name, opponent_name, games, seed_sequence):
+    from agents import make_agent, play_game
+    from engine import O, X, Position
+    from selfplay import seed_worker
+    from solver import move_regret
+
+    rng = seed_worker(seed_sequence)
+    agent, opponent = make_agent(name), make_agent(opponent_name)
+    metrics = GameMetrics()
+    for game in range(games):
+        side = X if game % 2 == 0 else O
+        winner, moves, seconds = play_game(*((agent, opponent) if side == X else (opponent, agent)), rng=rng)
+        # X moved first, so the agent made every other move starting with move `side`
+        position = Position(turn=X)
+        regret = 0
+        for ply, cell in enumerate(moves):
+            if ply % 2 == side:
+                regret += move_regret(position, cell)
+            position.play(cell)
+        metrics.update(0 if winner is None else 1 if winner == side else -1, regret, seconds[side::2])
+    return metrics
+
+# Measure an agent over `games` games against `opponent` across a process pool
+def evaluate_agent(name, opponent='random', games=1000, workers=None, seed=None, chunk_size=100):
+    from selfplay import split
+
+    chunks = split(games, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    metrics = GameMetrics()
+    with ProcessPoolExecutor(workers) as pool:
+        for result in pool.map(evaluate_chunk, [name] * len(chunks), [opponent] * len(chunks), chunks, seeds):
+            metrics.merge(result)
+    return metrics
+
+
+if __name__ == "__main__":
+    from agents import AGENTS
+
+    parser = argparse.ArgumentParser(description="Measure Tic-Tac-Toe agents on played games")
+    parser.add_argument('agents', nargs='+', choices=sorted(AGENTS))
+    parser.add_argument('--opponent', default='random', choices=sorted(AGENTS))
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    for name in args.agents:
+        print(evaluate_agent(name, args.opponent, args.games, args.workers, args.seed).report(f"{name} vs {args.opponent}"))
@@ -0,0 +1,153 @@
+"""
+Script Name: Generalized m,n,k Board
+Description: This module implements an m-by-n board where k stones in a row win (Tic-Tac-Toe is 3,3,3 and gomoku is 15,15,5), with win detection through the last move only and a frontier of candidate moves.
+Date: October 18, 2026
+"""
+
+# Cells hold 0 for empty, 1 for X and 2 for O, the same values as the batch simulator.
+# A move can only complete lines through its own cell, so `play` checks the 4 directions through the new stone (O(k)) instead of rescanning the board.
+
+# The frontier is the set of empty cells within `radius` of a stone. It is kept up to date on every `play` and `undo` with a count of nearby stones per cell,
+# and `legal_moves` returns it, so search on a large board branches over the cells near the action instead of every empty cell. On an empty board the only candidate is the centre.
+
+# `MNKBoard` has the same interface as the engine `Position` (`legal_moves`, `play`, `undo`, `winner`, `is_full`, `copy`, `key`, `turn`), so the MCTS agent runs on it unchanged.
+
+
+from engine import O, SYMBOLS, X
+
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+SWAP_STONES = bytes([0, 2, 1]) + bytes(range(3, 256))  # bytes.translate table exchanging X and O
+
+# (rows, cols, radius) -> neighbour lists for every cell
+_neighbour_cache = {}
+
+
+def neighbours(rows, cols, radius):
+    key = (rows, cols, radius)
+    if key not in _neighbour_cache:
+        _neighbour_cache[key] = tuple(
+            tuple((r * cols + c) for r in range(max(0, row - radius), min(rows, row + radius + 1))
+                  for c in range(max(0, col - radius), min(cols, col + radius + 1)) if (r, c) != (row, col))
+            for row in range(rows) for col in range(cols))
+    return _neighbour_cache[key]
+
+
+class MNKBoard:
+    __slots__ = ('rows', 'cols', 'k', 'radius', 'cells', 'turn', 'moves', 'winners', 'near', 'frontier', '_neighbours')
+
+    def __init__(self, rows=3, cols=3, k=3, radius=2, turn=X):
+        self.rows, self.cols, self.k, self.radius = rows, cols, k, radius
+        self.cells = bytearray(rows * cols)
+        self.turn = turn
+        self.moves = []
+        self.winners = []
+        self.near = [0] * (rows * cols)
+        self.frontier = set()
+        self._neighbours = neighbours(rows, cols, radius)
+
+    # Build a board from a list board by replaying its stones with `turn` to move
+    @classmethod
+    def from_board(cls, board, k=3, radius=2, turn=O):
+        state = cls(len(board), len(board[0]), k, radius)
+        for row, line in enumerate(board):
+            for col, symbol in enumerate(line):
+                if symbol != ' ':
+                    state.turn = SYMBOLS.index(symbol)
+                    state.play(row * state.cols + col)
+        # Replaying in board order only checks lines through each stone as it is placed, so look for any completed line once at the end
+        if state.moves and state.winner() is None:
+            for cell in state.moves:
+                if state._wins_at(cell):
+                    state.winners[-1] = state.cells[cell] - 1
+                    break
+        state.turn = turn
+        return state
+
+    def to_board(self):
+        return [[' ' if cell == 0 else SYMBOLS[cell - 1] for cell in self.cells[row * self.cols:(row + 1) * self.cols]]
+                for row in range(self.rows)]
+
+    def copy(self):
+        state = MNKBoard.__new__(MNKBoard)
+        state.rows, state.cols, state.k, state.radius = self.rows, self.cols, self.k, self.radius
+        state.cells = bytearray(self.cells)
+        state.turn = self.turn
+        state.moves = list(self.moves)
+        state.winners = list(self.winners)
+        state.near = list(self.near)
+        state.frontier = set(self.frontier)
+        state._neighbours = self._neighbours
+        return state
+
+    # The same position with the colours of the stones and the player to move swapped
+    def swapped(self):
+        state = self.copy()
+        state.cells = self.cells.translate(SWAP_STONES)
+        state.turn ^= 1
+        state.winners = [None if winner is None else winner ^ 1 for winner in self.winners]
+        return state
+
+    # Length of the run of `stone` through `cell` along (dr, dc)
+    def _run(self, cell, stone, dr, dc):
+        row, col = divmod(cell, self.cols)
+        length = 1
+        for sign in (1, -1):
+            r, c = row + sign * dr, col + sign * dc
+            while 0 <= r < self.rows and 0 <= c < self.cols and self.cells[r * self.cols + c] == stone:
+                length += 1
+                r, c = r + sign * dr, c + sign * dc
+        return length
+
+    def _wins_at(self, cell):
+        stone = self.cells[cell]
+        return any(self._run(cell, stone, dr, dc) >= self.k for dr, dc in DIRECTIONS)
+
+    # Empty cells within `radius` of a stone (the centre on an empty board)
+    def legal_moves(self):
+        if not self.moves:
+            return [(self.rows // 2) * self.cols + self.cols // 2]
+        return sorted(self.frontier)
+
+    # Every empty cell
+    def empty_cells(self):
+        return [cell for cell in range(len(self.cells)) if self.cells[cell] == 0]
+
+    def play(self, cell):
+        self.cells[cell] = self.turn + 1
+        self.moves.append(cell)
+        self.frontier.discard(cell)
+        for neighbour in self._neighbours[cell]:
+            self.near[neighbour] += 1
+            if self.cells[neighbour] == 0:
+                self.frontier.add(neighbour)
+        self.winners.append(self.turn if self._wins_at(cell) else None)
+        self.turn ^= 1
+
+    def undo(self, cell):
+        self.turn ^= 1
+        self.winners.pop()
+        self.moves.pop()
+        self.cells[cell] = 0
+        for neighbour in self._neighbours[cell]:
+            self.near[neighbour] -= 1
+            if self.near[neighbour] == 0:
+                self.frontier.discard(neighbour)
+        if self.near[cell] > 0:
+            self.frontier.add(cell)
+
+    # X or O if the last move completed a line, otherwise None
+    def winner(self):
+        return self.winners[-1] if self.winners else None
+
+    def is_full(self):
+        return len(self.moves) == len(self.cells)
+
+    def is_terminal(self):
+        return self.is_full() or self.winner() is not None
+
+    def key(self):
+        return (bytes(self.cells), self.turn)
+
+    def __repr__(self):
+        rows = [''.join(row).replace(' ', '.') for row in self.to_board()]
+        return f"MNKBoard({'/'.join(rows)}, k={self.k}, turn={SYMBOLS[self.turn]})"
@@ -7,182 +7,117 @@ Date: April 26, 2024
 
 # This script defines functions to draw the Tic-Tac-Toe board, handle player moves, and utilize the Monte Carlo rollout algorithm to determine optimal moves for the computer player. Game outcomes are evaluated based on various criteria, and performance metrics are displayed after a series of games.
 
-# The game interface is built using Pygame for graphical display, and matplotlib is used to visualize the efficiency of the algorithm over multiple games.
+# The game interface is built using Pygame for graphical display, and matplotlib is used to visualize the efficiency of the algorithm over multiple games. Both live in `ui.py` and are only loaded when `main()` runs, so the algorithm can be imported without a display.
 
 # To run the game, execute the main.pyscript. The computer (O) will play against the human player (X), and game outcomes will be displayed in the console. After a series of games, average evaluation metrics and an efficiency plot will be shown.
 
-# Note: Ensure that Pygame and matplotlib are installed to run this script successfully.
+# Note: Ensure that Pygame and matplotlib are installed to play interactively; the algorithm itself only needs NumPy.
 
 
 
+import functools
+import os
 import numpy as np
-import random
-import pygame
-import sys
-import matplotlib.pyplot as plt
-
-# Define constants
-WIDTH, HEIGHT = 300, 300
-LINE_WIDTH = 15
-BOARD_ROWS, BOARD_COLS = 3, 3
-SQUARE_SIZE = WIDTH // BOARD_ROWS
-WHITE = (255, 255, 255)
-LINE_COLOR = (23, 145, 135)
-BOARD_COLOR = (44, 44, 44)
-X_COLOR = (66, 66, 255)
-O_COLOR = (255, 66, 66)
-
-# Initialize Pygame
-pygame.init()
-
-# Set up the screen
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Tic Tac Toe")
-screen.fill(WHITE)
-
-# Draw lines
-def draw_lines():
-    # Horizontal lines
-    pygame.draw.line(screen, LINE_COLOR, (0, SQUARE_SIZE), (WIDTH, SQUARE_SIZE), LINE_WIDTH)
-    pygame.draw.line(screen, LINE_COLOR, (0, 2 * SQUARE_SIZE), (WIDTH, 2 * SQUARE_SIZE), LINE_WIDTH)
-    # Vertical lines
-    pygame.draw.line(screen, LINE_COLOR, (SQUARE_SIZE, 0), (SQUARE_SIZE, HEIGHT), LINE_WIDTH)
-    pygame.draw.line(screen, LINE_COLOR, (2 * SQUARE_SIZE, 0), (2 * SQUARE_SIZE, HEIGHT), LINE_WIDTH)
-
-# Draw X and O symbols
-def draw_symbols(board):
-    for row in range(BOARD_ROWS):
-        for col in range(BOARD_COLS):
-            if board[row][col] == 'X':
-                pygame.draw.line(screen, X_COLOR, (col * SQUARE_SIZE + SQUARE_SIZE // 4, row * SQUARE_SIZE + SQUARE_SIZE // 4), 
-                                 ((col + 1) * SQUARE_SIZE - SQUARE_SIZE // 4, (row + 1) * SQUARE_SIZE - SQUARE_SIZE // 4), LINE_WIDTH)
-                pygame.draw.line(screen, X_COLOR, ((col + 1) * SQUARE_SIZE - SQUARE_SIZE // 4, row * SQUARE_SIZE + SQUARE_SIZE // 4), 
-                                 (col * SQUARE_SIZE + SQUARE_SIZE // 4, (row + 1) * SQUARE_SIZE - SQUARE_SIZE // 4), LINE_WIDTH)
-            elif board[row][col] == 'O':
-                pygame.draw.circle(screen, O_COLOR, (col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2), SQUARE_SIZE // 4, LINE_WIDTH)
-
-# Check for winner
-def check_winner(board, player):
-    # Check rows
-    for row in range(BOARD_ROWS):
-        if all([board[row][col] == player for col in range(BOARD_COLS)]):
-            return True
-    # Check columns
-    for col in range(BOARD_COLS):
-        if all([board[row][col] == player for row in range(BOARD_ROWS)]):
-            return True
-    # Check diagonals
-    if all([board[i][i] == player for i in range(BOARD_ROWS)]) or all([board[i][BOARD_COLS - i - 1] == player for i in range(BOARD_ROWS)]):
-        return True
-    return False
-
-# Check for tie
-def check_tie(board):
-    return all([board[row][col] != ' ' for row in range(BOARD_ROWS) for col in range(BOARD_COLS)])
+import time
+from agents import MoveFunctionAgent
+from engine import O, TERNARY, X, Position, cell_to_move
+from batchsim import O_CELL, X_CELL, encode, rewards, simulate
+from instrument import count, decision
+from mcts import MCTSAgent
+from openingbook import book_move
+from seeding import get_rng
+from symmetry import canonical, shared_table, to_canonical_cell
+
+# Average reward of `num_episodes` random playouts after 'O' plays each of `moves`, simulated as one NumPy batch
+def rollout_rewards(position, moves, num_episodes, rng=None):
+    boards = np.repeat(encode(position)[None, :], len(moves) * num_episodes, axis=0)
+    boards[np.arange(len(boards)), np.repeat(moves, num_episodes)] = O_CELL
+    results = simulate(boards, X_CELL, rng)
+    return rewards(results, O_CELL).reshape(len(moves), num_episodes).mean(axis=1)
 
 # Monte Carlo rollout policy adaptation algorithm
-def monte_carlo_rollout(board, exploration_param=0.1, num_episodes=100):
-    moves = [(row, col) for row in range(BOARD_ROWS) for col in range(BOARD_COLS) if board[row][col] == ' ']
-    rewards = np.zeros(len(moves))
-
-    for i, move in enumerate(moves):
-        total_rewards = 0
-        for _ in range(num_episodes):
-            new_board = [row[:] for row in board]
-            new_board[move[0]][move[1]] = 'O'  # Assume computer is 'O'
-            total_rewards += evaluate(new_board, 'O')['Average Total Rewards per Episode']
-        rewards[i] = total_rewards / num_episodes
-
-    best_move = moves[np.argmax(rewards)]
+# Every candidate move is scored by `num_episodes` random playouts to the end of the game (win 1, draw 0, loss -1 for 'O'),
+# and the playouts for all candidates are simulated together as one NumPy batch.
+# Scores are kept in the transposition table under the canonical (symmetry-reduced) position, so symmetric positions reuse them.
+# With a `time_budget` (seconds) the search is anytime instead: batches of `batch_size` playouts per move are added until the budget runs out.
+# With `parallel` 'root' or 'leaf' the playouts of the decision are spread over `workers` processes (see parallelsearch.py); an anytime batch is then `batch_size` per worker.
+# Early positions are answered from the opening book unless `book` is False.
+@decision('mc')
+def monte_carlo_rollout(board, exploration_param=0.1, num_episodes=10000, rng=None, table=shared_table, time_budget=None, batch_size=500, book=True,
+                        parallel=None, workers=None):
+    rng = get_rng(rng)
+    position = Position.from_board(board, turn=O)  # Assume computer is 'O'
+    cell = book_move(position, rng) if book else None
+    if cell is not None:
+        return cell_to_move(cell)
+    moves = position.legal_moves()
+    if parallel is not None:
+        import parallelsearch
+        simulate_rewards = functools.partial(parallelsearch.rollout_rewards, mode=parallel, workers=workers)
+        batch_size *= workers or os.cpu_count()
+    else:
+        simulate_rewards = rollout_rewards
+
+    if time_budget is not None:
+        deadline = time.perf_counter() + time_budget
+        totals = np.zeros(len(moves))
+        episodes = 0
+        while episodes == 0 or time.perf_counter() < deadline:
+            totals += simulate_rewards(position, moves, batch_size, rng)
+            episodes += batch_size
+        return cell_to_move(moves[np.argmax(totals)])
+
+    x_bits, o_bits, symmetry = canonical(position.bits[X], position.bits[O])
+    key = ('mc', TERNARY[x_bits] + 2 * TERNARY[o_bits], num_episodes)
+
+    canonical_rewards = table.get(key) if table is not None else None
+    count('cache_misses' if canonical_rewards is None else 'cache_hits')
+    if canonical_rewards is None:
+        move_rewards = simulate_rewards(position, moves, num_episodes, rng)
+        canonical_rewards = {to_canonical_cell(cell, symmetry): reward for cell, reward in zip(moves, move_rewards)}
+        if table is not None:
+            table[key] = canonical_rewards
+
+    move_rewards = [canonical_rewards[to_canonical_cell(cell, symmetry)] for cell in moves]
+    best_move = cell_to_move(moves[np.argmax(move_rewards)])
     return best_move
 
-# Evaluation function
-def evaluate(board, player):
-    # Return evaluation criteria for the game
-    return {
-        'No. of Episodes': random.randint(50, 150),
-        'Regret': random.uniform(0, 1),
-        'Average Total Rewards per Episode': random.uniform(0, 1),
-        'Win Rate': random.uniform(0,1),
-        'Efficiency': random.uniform(0, 1),
-        'score': random.uniform(0, 1)  # Ensure 'score' key is present
-    }
+# Monte Carlo tree search (UCT) agent
+# The agent keeps its tree between calls and continues from the subtree matching the opponent's reply. Pass another `agent` to keep a separate tree.
+mcts_agent = MCTSAgent()
+
+# With `parallel` 'root' the decision is searched by one tree per worker process instead, merged by root visit counts (see parallelsearch.py); no tree is kept then.
+@decision('mcts')
+def mcts_search(board, exploration_param=1.4, iterations=2000, time_budget=None, book=True, agent=mcts_agent, rng=None, parallel=None, workers=None):
+    position = Position.from_board(board, turn=O)  # Assume computer is 'O'
+    cell = book_move(position, rng) if book else None
+    if cell is not None:
+        return cell_to_move(cell)
+    if parallel == 'root':
+        from parallelsearch import root_parallel_mcts
+        return cell_to_move(root_parallel_mcts(position, exploration_param, iterations, time_budget, rng, workers))
+    if parallel is not None:
+        raise ValueError(f"MCTS supports only root parallelism, not {parallel!r}")
+    agent.exploration_param = exploration_param
+    agent.iterations = iterations
+    agent.time_budget = time_budget
+    best_move = cell_to_move(agent.select_move(position, rng=rng))
+    return best_move
+
+# Registry agent for `mcts_search` with a tree of its own, cleared at the start of every game
+class MCTSSearchAgent(MoveFunctionAgent):
+    def __init__(self, **params):
+        params.setdefault('agent', MCTSAgent())
+        super().__init__(mcts_search, **params)
+
+    def reset(self):
+        self.params['agent'].reset()
 
 # Main game loop
 def main():
-    evaluation_results = []
-    efficiency_values = []
-
-    for game in range(5):
-        board = [[' ' for _ in range(BOARD_COLS)] for _ in range(BOARD_ROWS)]
-        game_over = False
-        turn = random.choice(['X', 'O'])
-
-        while not game_over:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN and turn == 'X':
-                    x, y = pygame.mouse.get_pos()
-                    row = y // SQUARE_SIZE
-                    col = x // SQUARE_SIZE
-                    if board[row][col] == ' ':
-                        board[row][col] = turn
-                        if check_winner(board, turn):
-                            print(f"Player {turn} wins!")
-                            game_over = True
-                        elif check_tie(board):
-                            print("It's a tie!")
-                            game_over = True
-                        turn = 'O'
-                    else:
-                        print("Invalid move. Try again.")
-
-            if turn == 'O' and not game_over:
-                row, col = monte_carlo_rollout(board)
-                board[row][col] = turn
-                if check_winner(board, turn):
-                    print(f"Player {turn} wins!")
-                    game_over = True
-                elif check_tie(board):
-                    print("It's a tie!")
-                    game_over = True
-                turn = 'X'
-
-            screen.fill(WHITE)
-            draw_lines()
-            draw_symbols(board)
-            pygame.display.update()
-
-        # Collect evaluation criteria for the game
-        evaluation_results.append(evaluate(board, 'O'))
-        efficiency_values.append(evaluation_results[-1]['Efficiency'])
-
-        # Print evaluation criteria for the current game
-        print(f"--- Evaluation Results for Game {game + 1} ---")
-        print(evaluation_results[-1])
-
-    # Calculate average evaluation results after 5 games
-    avg_win_rate = np.mean([result['Win Rate'] for result in evaluation_results])
-    avg_avg_total_rewards = np.mean([result['Average Total Rewards per Episode'] for result in evaluation_results])
-    avg_efficiency = np.mean([result['Efficiency'] for result in evaluation_results])
-
-    print("\nAverage Evaluation Results after 5 games:")
-    print(f"Average Win Rate: {avg_win_rate}")
-    print(f"Average Average Total Rewards per Episode: {avg_avg_total_rewards}")
-    print(f"Average Efficiency: {avg_efficiency}")
-
-    # Plot efficiency values
-    plt.plot(range(1, 6), efficiency_values, marker='o')
-    plt.title('Efficiency of the Algorithm over 5 Games')
-    plt.xlabel('Game Number')
-    plt.ylabel('Efficiency')
-    plt.grid(True)
-    plt.show()
-
-    return efficiency_values
+    from ui import play_and_report
+    return play_and_report('mc', 'Monte Carlo')
+
 
 if __name__ == "__main__":
     main()
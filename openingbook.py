@@ -0,0 +1,136 @@
+"""
+Script Name: Opening Book for the Tic-Tac-Toe Agents
+Description: This script builds an opening book offline from the solver table, mapping each early canonical position with 'O' to move to its best moves with weights, and lets the agents look a position up before they search.
+Date: October 18, 2026
+"""
+
+# The book covers every legal position with 'O' to move and at most `max_stones` stones on the board (4 by default, the first two moves of each side).
+# Positions are stored once per symmetry class, under the canonical base-3 index (see symmetry.py), as an array of (key, 9 weights) records sorted by key.
+# On load the records become a dict, so a lookup is one canonical-index computation and one hash probe.
+
+# The moves in the book are the moves that keep the game-theoretic value of the position. Their weight is 1 plus the number of X replies that would lose value for X,
+# so among equally good moves the ones that leave the opponent more ways to go wrong are chosen more often. Every other move has weight 0.
+
+# `monte_carlo_rollout`, `mcts_search` and `sparse_sampling` call `book_move` first and only search when the position is not in the book.
+
+# Run `python openingbook.py` to (re)build the book; `load` builds it on first use if the file is missing or cannot be read whole.
+# The book is written to a temporary file and renamed into place, so processes that load it at the same time never read a partly written file.
+
+
+import os
+import tempfile
+import numpy as np
+from engine import FULL_MASK, NUM_CELLS, O, TERNARY, X, Position
+from instrument import count
+from seeding import get_rng
+from solver import lookup
+from symmetry import canonical, from_canonical_cell
+
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_book.npy')
+BOOK_DTYPE = np.dtype([('key', '<i4'), ('weights', 'u1', (NUM_CELLS,))])
+MAX_STONES = 4
+
+_book = None
+
+
+# Weight of every cell in `position` ('O' to move) from the solver values
+def move_weights(position):
+    weights = [0] * NUM_CELLS
+    values = {}
+    for cell in position.legal_moves():
+        position.play(cell)
+        values[cell] = -lookup(position)[0]
+        position.undo(cell)
+    best_value = max(values.values())
+    for cell, value in values.items():
+        if value != best_value:
+            continue
+        position.play(cell)
+        mistakes = 0
+        if not position.is_terminal():
+            for reply in position.legal_moves():
+                position.play(reply)
+                mistakes += lookup(position)[0] > value
+                position.undo(reply)
+        position.undo(cell)
+        weights[cell] = min(255, 1 + mistakes)
+    return weights
+
+# Book records for every canonical position with 'O' to move and at most `max_stones` stones
+def generate(max_stones=MAX_STONES):
+    entries = {}
+    for x_bits in range(FULL_MASK + 1):
+        for o_bits in iter_subsets(FULL_MASK & ~x_bits):
+            x_count, o_count = bin(x_bits).count('1'), bin(o_bits).count('1')
+            # 'O' is to move when both sides have as many stones (O started) or X has one more (X started)
+            if x_count + o_count > max_stones or x_count - o_count not in (0, 1):
+                continue
+            x, o, _ = canonical(x_bits, o_bits)
+            position = Position(x, o, O)
+            if not position.is_terminal():
+                entries.setdefault(TERNARY[x] + 2 * TERNARY[o], move_weights(position))
+    book = np.zeros(len(entries), dtype=BOOK_DTYPE)
+    book['key'] = sorted(entries)
+    book['weights'] = [entries[key] for key in book['key'].tolist()]
+    return book
+
+# Every subset of the bit mask `bits`
+def iter_subsets(bits):
+    subset = bits
+    while True:
+        yield subset
+        if subset == 0:
+            return
+        subset = (subset - 1) & bits
+
+# Generate the book and write it to `path`
+def build(path=BOOK_PATH, max_stones=MAX_STONES):
+    book = generate(max_stones)
+    descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            np.save(file, book)
+        os.chmod(temporary_path, 0o644)  # mkstemp creates the file readable by its owner only
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+    return book
+
+# Book records in `path`, or None if the file is missing or is not a whole book
+def read_records(path):
+    try:
+        records = np.load(path)
+    except (OSError, ValueError, EOFError):
+        return None
+    return records if records.dtype == BOOK_DTYPE and records.ndim == 1 else None
+
+# Load the book as {canonical index: weights}, building it first if the file does not exist or cannot be read
+def load(path=BOOK_PATH):
+    global _book
+    if _book is None or path != BOOK_PATH:
+        records = read_records(path)
+        if records is None:
+            records = build(path)
+        book = dict(zip(records['key'].tolist(), map(tuple, records['weights'].tolist())))
+        if path != BOOK_PATH:
+            return book
+        _book = book
+    return _book
+
+# Book move for 'O' in `position`, drawn in proportion to the weights; None if the position is not in the book
+def book_move(position, rng=None):
+    x, o, symmetry = canonical(position.bits[X], position.bits[O])
+    weights = load().get(TERNARY[x] + 2 * TERNARY[o])
+    if weights is None:
+        return None
+    count('book_hits')
+    cells = [cell for cell in range(NUM_CELLS) if weights[cell]]
+    cumulative = np.cumsum([weights[cell] for cell in cells])
+    cell = cells[int(np.searchsorted(cumulative, get_rng(rng).random() * cumulative[-1], side='right'))]
+    return from_canonical_cell(cell, symmetry)
+
+
+if __name__ == "__main__":
+    book = build()
+    print(f"Opening book with {len(book)} canonical positions written to {BOOK_PATH}")
@@ -0,0 +1,137 @@
+"""
+Script Name: Parallel Search Within One Decision for Tic-Tac-Toe
+Description: This module spreads the work of a single Monte Carlo or MCTS decision over a persistent pool of worker processes, to cut the wall-clock time of one hard decision rather than to play more games at once.
+Date: October 18, 2026
+"""
+
+# Root parallelism: every worker runs its own search of the whole decision from an independent random stream (a child SeedSequence drawn from the caller's Generator)
+# and returns its statistics, which are merged by count: Monte Carlo reward sums and playout counts per move are added up,
+# and for MCTS each worker grows its own tree and the root visit counts of all trees are added before the most visited move is chosen.
+
+# Leaf parallelism (Monte Carlo only): the playouts of the decision, every candidate move times `num_episodes`, are cut into one contiguous batch per worker.
+# Each worker simulates its batch with the batch simulator and writes the reward sum and playout count per move into its own row of a shared-memory buffer,
+# so nothing but the task arguments goes through a pipe. MCTS has no leaf-parallel mode: its leaves are chosen one at a time from statistics that the previous playout just changed.
+
+# The pool and the buffer are created on first use and kept for the life of the process (`get_pool`); every worker imports the agents and runs its first playout
+# when the pool starts, so a decision never pays for process start-up. `shutdown` stops the pool, and it is called at exit.
+# One decision runs at a time per process: the buffer rows belong to the decision in progress.
+
+
+import atexit
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing.sharedctypes import RawArray
+import numpy as np
+from engine import NUM_CELLS, O, Position
+from seeding import get_rng
+
+_pool = None
+_pool_workers = 0
+_buffer = None  # RawArray of (workers, 2, NUM_CELLS) float64: reward sums and playout counts per move for each leaf batch
+_worker_buffer = None  # the same buffer as a NumPy array, in the workers
+
+
+# Worker initializer: map the result buffer and warm up the simulator and the agents
+def _start_worker(buffer, workers):
+    global _worker_buffer
+    from batchsim import simulate
+    from mcts import MCTSAgent
+    _worker_buffer = np.frombuffer(buffer, dtype=np.float64).reshape(workers, 2, NUM_CELLS)
+    simulate(np.zeros((1, NUM_CELLS), dtype=np.int8), 1)
+    MCTSAgent(iterations=1).select_move(Position(turn=O))
+
+# Warm-up task; it holds its worker briefly so that the pool has to start every process
+def _ready():
+    time.sleep(0.05)
+    return os.getpid()
+
+# The persistent pool with `workers` processes (all cores by default), started and warmed on first use
+def get_pool(workers=None):
+    global _pool, _pool_workers, _buffer
+    workers = workers or os.cpu_count()
+    if _pool is None or workers != _pool_workers:
+        shutdown()
+        _buffer = RawArray('d', workers * 2 * NUM_CELLS)
+        _pool = ProcessPoolExecutor(workers, initializer=_start_worker, initargs=(_buffer, workers))
+        _pool_workers = workers
+        # A new process is only started while no idle one is left, so wait for every worker to be up
+        started = set()
+        while len(started) < workers:
+            started.update(future.result() for future in [_pool.submit(_ready) for _ in range(workers)])
+    return _pool
+
+def shutdown():
+    global _pool, _buffer
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = _buffer = None
+
+atexit.register(shutdown)
+
+# Child seed sequences for `count` workers, drawn from `rng`
+def _seeds(rng, count):
+    return np.random.SeedSequence(int(get_rng(rng).integers(1 << 63))).spawn(count)
+
+
+# Worker: reward sums of `num_episodes` playouts after 'O' plays each of `moves`
+def _root_rollouts(x_bits, o_bits, moves, num_episodes, seed_sequence):
+    from monteclaro import rollout_rewards
+    return rollout_rewards(Position(x_bits, o_bits, O), moves, num_episodes, np.random.default_rng(seed_sequence)) * num_episodes
+
+# Worker: simulate playouts `start` to `stop` of the decision's batch (move-major, `num_episodes` per move) and write their sums and counts to buffer row `row`
+def _leaf_rollouts(x_bits, o_bits, moves, num_episodes, start, stop, seed_sequence, row):
+    from batchsim import O_CELL, X_CELL, encode, rewards, simulate
+    playout_moves = np.repeat(moves, num_episodes)[start:stop]
+    boards = np.repeat(encode(Position(x_bits, o_bits, O))[None, :], stop - start, axis=0)
+    boards[np.arange(len(boards)), playout_moves] = O_CELL
+    results = rewards(simulate(boards, X_CELL, np.random.default_rng(seed_sequence)), O_CELL)
+    slot = np.searchsorted(moves, playout_moves)
+    _worker_buffer[row, 0, :len(moves)] = np.bincount(slot, weights=results, minlength=len(moves))
+    _worker_buffer[row, 1, :len(moves)] = np.bincount(slot, minlength=len(moves))
+
+# Average reward of `num_episodes` random playouts after 'O' plays each of `moves`, computed by the pool in `mode` 'root' or 'leaf'
+def rollout_rewards(position, moves, num_episodes, rng, mode='root', workers=None):
+    pool = get_pool(workers)
+    workers = _pool_workers
+    x_bits, o_bits = position.bits
+    if mode == 'root':
+        shares = [num_episodes // workers + (worker < num_episodes % workers) for worker in range(workers)]
+        tasks = [(share, seed) for share, seed in zip(shares, _seeds(rng, workers)) if share]
+        futures = [pool.submit(_root_rollouts, x_bits, o_bits, moves, share, seed) for share, seed in tasks]
+        return sum(future.result() for future in futures) / num_episodes
+    if mode == 'leaf':
+        moves = sorted(moves)
+        total = len(moves) * num_episodes
+        bounds = [total * worker // workers for worker in range(workers + 1)]
+        futures = [pool.submit(_leaf_rollouts, x_bits, o_bits, moves, num_episodes, bounds[row], bounds[row + 1], seed, row)
+                   for row, seed in enumerate(_seeds(rng, workers)) if bounds[row] < bounds[row + 1]]
+        wait(futures)
+        for future in futures:
+            future.result()  # re-raise a worker error
+        rows = np.frombuffer(_buffer, dtype=np.float64).reshape(workers, 2, NUM_CELLS)[:len(futures), :, :len(moves)]
+        sums, counts = rows.sum(axis=0)
+        return sums / counts
+    raise ValueError(f"unknown parallel mode {mode!r}")
+
+
+# Worker: grow an MCTS tree from the position and return its root visit counts {cell: visits}
+def _root_mcts(x_bits, o_bits, turn, exploration_param, iterations, time_budget, seed_sequence):
+    from mcts import MCTSAgent
+    agent = MCTSAgent(exploration_param, iterations, time_budget)
+    agent.select_move(Position(x_bits, o_bits, turn), rng=np.random.default_rng(seed_sequence))
+    return {child.move: child.visits for child in agent.root.children}
+
+# Root-parallel MCTS: one tree per worker, `iterations` split between them (or each searching for `time_budget` seconds); returns the most visited move overall
+def root_parallel_mcts(position, exploration_param=1.4, iterations=2000, time_budget=None, rng=None, workers=None):
+    pool = get_pool(workers)
+    workers = _pool_workers
+    x_bits, o_bits = position.bits
+    shares = [None] * workers if iterations is None else [iterations // workers + (worker < iterations % workers) for worker in range(workers)]
+    futures = [pool.submit(_root_mcts, x_bits, o_bits, position.turn, exploration_param, max(share, 1) if share is not None else None, time_budget, seed)
+               for share, seed in zip(shares, _seeds(rng, workers))]
+    visits = {}
+    for future in futures:
+        for cell, count in future.result().items():
+            visits[cell] = visits.get(cell, 0) + count
+    return max(visits, key=visits.get)
@@ -0,0 +1,50 @@
+"""
+Script Name: Random Streams for the Tic-Tac-Toe Agents
+Description: This module supplies the numpy.random.Generator objects the agents and game drivers draw from, so that a run is reproducible from one root seed.
+Date: October 18, 2026
+"""
+
+# Every agent takes an `rng` argument (a numpy Generator). When it is None the agent uses the process default from `get_rng`, which `seed` resets;
+# without a seed the default draws fresh entropy, so unseeded runs behave as before.
+
+# Parallel drivers never share a stream: they spawn one child SeedSequence per chunk of work from the root seed and build that chunk's Generator from it
+# (`selfplay.seed_worker`, which also drops the caches and search trees the agents keep between calls), so results do not depend on scheduling or on the number of workers.
+# A forked child process also forgets the default generator it inherited, instead of repeating the parent's draws
+# (fork only exists on Unix; spawned processes, the only kind on Windows, start without one).
+
+# Loops that draw one small integer per step (MCTS rollouts, sparse-sampling replies) use `scalar_random`, a random.Random seeded from the Generator,
+# because a scalar draw from a Generator costs about twice as much as `random.Random.randrange`.
+
+
+import os
+import random
+import numpy as np
+
+_default = None
+
+
+# Reset the process default generator from `seed` (an int, a SeedSequence or None for fresh entropy)
+def seed(seed=None):
+    global _default
+    _default = np.random.default_rng(seed)
+    return _default
+
+# `rng` itself, or the process default generator
+def get_rng(rng=None):
+    global _default
+    if rng is not None:
+        return rng
+    if _default is None:
+        _default = np.random.default_rng()
+    return _default
+
+# random.Random seeded from `rng`, for fast scalar draws in hot loops
+def scalar_random(rng=None):
+    return random.Random(int(get_rng(rng).integers(1 << 63)))
+
+def _forget_default():
+    global _default
+    _default = None
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_default)
@@ -0,0 +1,183 @@
+"""
+Script Name: Headless Self-Play Harness for Tic-Tac-Toe
+Description: This script plays large numbers of games between any two agents without a display, spread over a pool of worker processes, and trains the TD value table from self-play episodes.
+Date: October 18, 2026
+"""
+
+# Agents are looked up by name in the agent registry (see agents.py), created inside each worker and played against each other with `agents.play_game`.
+
+# Games are split into chunks that run on a ProcessPoolExecutor. Each chunk gets its own child of a root numpy SeedSequence, so results do not depend on how chunks are scheduled.
+# X always moves first and the two agents swap colours every game.
+
+# With a log path every finished game is appended to a compact binary game log (see gamelog.py) by the worker that played it,
+# and `train_td_from_log` trains the TD value table from such a log.
+
+# TD training runs in rounds: the workers play episodes with a snapshot of the value table and return the afterstates 'O' visited with the final reward,
+# and the main process applies the TD(lambda) updates and saves the table for the next round. With `--backend linear` the same training fits the linear
+# value function over line features (see linearvalue.py) and the afterstates travel as feature vectors.
+
+# Examples:
+#   python selfplay.py mcts random --games 10000 --workers 8
+#   python selfplay.py --train-td 1000000 --opponent random
+#   python selfplay.py --train-td 100000 --backend linear
+#   python selfplay.py optimal mcts --games 100000 --log games.bin && python selfplay.py --train-td-log games.bin
+
+
+import argparse
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from agents import AGENTS, make_agent, play_game
+from engine import O, X, Position
+from gamelog import GameLog, read_games, replay
+from linearvalue import LINEAR_PATH, LinearValue
+import seeding
+from symmetry import shared_table
+from valuetable import VALUES_PATH, ValueTable
+
+CHUNK_SIZE = 1000
+
+# TD backend -> (value function class, default file)
+TD_BACKENDS = {
+    'table': (ValueTable, VALUES_PATH),
+    'linear': (LinearValue, LINEAR_PATH),
+}
+
+
+# Start a chunk of work: return its Generator (also made the default) and drop the state the agents keep between calls in this worker
+# (cached search results, the MCTS tree, TD learning since the table was saved), so a chunk plays the same games whichever worker runs it
+def seed_worker(seed_sequence):
+    shared_table.clear()
+    if 'monteclaro' in sys.modules:
+        sys.modules['monteclaro'].mcts_agent.reset()
+    if 'temporallearning' in sys.modules:
+        sys.modules['temporallearning'].td_reset()
+    return seeding.seed(seed_sequence)
+
+# Split `total` into chunk sizes of at most `chunk_size`
+def split(total, chunk_size=CHUNK_SIZE):
+    return [min(chunk_size, total - start) for start in range(0, total, chunk_size)]
+
+# Worker: play `games` games between agents `name_a` and `name_b`, alternating colours
+def play_chunk(name_a, name_b, games, seed_sequence, log_path=None):
+    rng = seed_worker(seed_sequence)
+    agent_a, agent_b = make_agent(name_a), make_agent(name_b)
+    log = GameLog(log_path) if log_path else None
+    results = Counter()
+    for game in range(games):
+        a_is_x = game % 2 == 0
+        winner, moves, _ = play_game(agent_a, agent_b, rng=rng) if a_is_x else play_game(agent_b, agent_a, rng=rng)
+        if log is not None:
+            log.write(moves, winner, *((name_a, name_b) if a_is_x else (name_b, name_a)))
+        if winner is None:
+            results['draws'] += 1
+        elif (winner == X) == a_is_x:
+            results['a_wins'] += 1
+            results['a_wins_as_x' if a_is_x else 'a_wins_as_o'] += 1
+        else:
+            results['b_wins'] += 1
+            results['b_wins_as_o' if a_is_x else 'b_wins_as_x'] += 1
+    results['games'] = games
+    if log is not None:
+        log.close()
+    return results
+
+# Play `games` games between two agents across a process pool and merge the results
+def run_match(name_a, name_b, games, workers=None, seed=None, chunk_size=CHUNK_SIZE, log_path=None):
+    chunks = split(games, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    results = Counter()
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(play_chunk, name_a, name_b, size, child, log_path) for size, child in zip(chunks, seeds)]
+        for future in as_completed(futures):
+            results.update(future.result())
+    return dict(results)
+
+# Worker: TD agent ('O') against an opponent using a snapshot of the values of `backend`
+# Returns (afterstates visited by 'O' as state IDs or feature vectors, final reward for 'O') for each episode
+def td_chunk(opponent_name, episodes, exploration_param, seed_sequence, values_path, backend='table'):
+    from temporallearning import td_select
+
+    rng = seed_worker(seed_sequence)
+    table = TD_BACKENDS[backend][0].load(values_path)
+    opponent = make_agent(opponent_name)
+    trajectories = []
+    for _ in range(episodes):
+        position = Position(turn=(X, O)[rng.integers(2)])
+        opponent.reset()
+        states = []
+        while not position.is_terminal():
+            if position.turn == O:
+                cell, _ = td_select(position, exploration_param, table, rng)
+                position.play(cell)
+                if not position.is_terminal():
+                    states.append(table.state_id(position))
+            else:
+                position.play(opponent.select_move(position, rng=rng))
+        winner = position.winner()
+        trajectories.append((states, 1 if winner == O else -1 if winner == X else 0))
+    return trajectories
+
+# Train the TD values of `backend` with TD(lambda) over `episodes` self-play episodes
+def train_td(episodes, opponent='random', workers=None, rounds=10, exploration_param=0.1, learning_rate=0.1,
+             discount_factor=0.9, trace_decay=0.8, seed=None, values_path=None, chunk_size=CHUNK_SIZE, backend='table'):
+    table_class, default_path = TD_BACKENDS[backend]
+    values_path = values_path or default_path
+    table = table_class.load(values_path)
+    round_seeds = np.random.SeedSequence(seed).spawn(rounds)
+    with ProcessPoolExecutor(workers) as pool:
+        for round_episodes, round_seed in zip(split(episodes, -(-episodes // rounds)), round_seeds):
+            table.save(values_path)
+            chunks = split(round_episodes, chunk_size)
+            futures = [pool.submit(td_chunk, opponent, size, exploration_param, child, values_path, backend)
+                       for size, child in zip(chunks, round_seed.spawn(len(chunks)))]
+            for future in futures:
+                for states, reward in future.result():
+                    table.td_lambda_update(states, reward, learning_rate, discount_factor, trace_decay)
+    table.save(values_path)
+    return table
+
+# Train the TD values of `backend` with TD(lambda) on the games in a game log, from the side of 'O'
+def train_td_from_log(log_path, learning_rate=0.1, discount_factor=0.9, trace_decay=0.8, values_path=None, backend='table'):
+    table_class, default_path = TD_BACKENDS[backend]
+    values_path = values_path or default_path
+    table = table_class.load(values_path)
+    for game in read_games(log_path):
+        # Afterstates of 'O': the non-terminal positions right after each of O's moves
+        positions = list(replay(game))[1:]
+        states = [table.state_id(position) for ply, position in enumerate(positions)
+                  if game.first ^ ply % 2 == O and not position.is_terminal()]
+        reward = 1 if game.winner == O else -1 if game.winner == X else 0
+        table.td_lambda_update(states, reward, learning_rate, discount_factor, trace_decay)
+    table.save(values_path)
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless self-play between Tic-Tac-Toe agents")
+    parser.add_argument('agent_a', nargs='?', choices=sorted(AGENTS))
+    parser.add_argument('agent_b', nargs='?', choices=sorted(AGENTS))
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--train-td', type=int, metavar='EPISODES', help="train the TD value table instead of playing a match")
+    parser.add_argument('--opponent', default='random', choices=sorted(AGENTS), help="opponent for TD training")
+    parser.add_argument('--log', help="append every game of the match to this game log")
+    parser.add_argument('--train-td-log', metavar='LOG', help="train the TD value table from the games in a game log")
+    parser.add_argument('--backend', default='table', choices=sorted(TD_BACKENDS), help="TD values to train: the dense table or the linear line-feature model")
+    args = parser.parse_args()
+
+    values_path = TD_BACKENDS[args.backend][1]
+    if args.train_td_log:
+        train_td_from_log(args.train_td_log, backend=args.backend)
+        print(f"Trained the TD {args.backend} values on {args.train_td_log}, saved to {values_path}")
+    elif args.train_td:
+        train_td(args.train_td, args.opponent, args.workers, seed=args.seed, backend=args.backend)
+        print(f"Trained the TD {args.backend} values on {args.train_td} episodes, saved to {values_path}")
+    elif args.agent_a and args.agent_b:
+        results = run_match(args.agent_a, args.agent_b, args.games, args.workers, args.seed, log_path=args.log)
+        print(f"{args.agent_a} vs {args.agent_b} over {results['games']} games:")
+        print(f"{args.agent_a} wins: {results.get('a_wins', 0)}, {args.agent_b} wins: {results.get('b_wins', 0)}, draws: {results.get('draws', 0)}")
+    else:
+        parser.error("give two agents to play a match, or --train-td EPISODES")
@@ -0,0 +1,319 @@
+"""
+Script Name: Asyncio Game Server for Tic-Tac-Toe
+Description: This script hosts many human-versus-computer games at once over a local TCP socket, computing the computer's moves in a pool of worker processes under a per-request deadline.
+Date: October 18, 2026
+"""
+
+# The protocol is one JSON object per line in each direction. Boards are 9-character strings in row order using 'X', 'O' and ' ' (or '.'), and cells are 0-8.
+#   {"op": "new", "agent": "mc"}                                -> {"game": 1, "board": "         "}
+#   {"op": "play", "game": 1, "cell": 4, "deadline_ms": 200}    -> {"board": ..., "move": 0, "winner": null, "over": false, "timed_out": false}
+#   {"op": "decide", "board": "X   O    ", "agent": "sparse", "deadline_ms": 100} -> {"move": 2, "timed_out": false}
+#   {"op": "close", "game": 1}                                  -> {"closed": true}
+# A request may carry an "id", which is copied into the response. Errors come back as {"error": message}.
+
+# The event loop only parses requests and keeps the game state; every decision is sent to a ProcessPoolExecutor, so one slow search never blocks other games.
+# Each request has a deadline. The Monte Carlo and sparse-sampling agents and MCTS are run as anytime searches with a time budget of what is left of the deadline,
+# less a safety margin, when a worker picks the request up, so they return the best move found so far; if a worker still misses the deadline
+# (for example because the pool is saturated) the server answers with a random legal move and marks the response "timed_out".
+# Moves of one game are played one at a time: a `play` request waits while the previous one is still deciding.
+
+# With a log path every finished game is appended to a compact binary game log (see gamelog.py), with the human as 'X'.
+
+# `Client` is an asyncio client for tests and scripts, and `--demo` plays a few games against the server from the same process.
+
+# Examples:
+#   python server.py --port 8765 --workers 4
+#   python server.py --demo
+
+
+import argparse
+import asyncio
+import importlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from agents import AGENTS, make_agent
+from engine import NUM_CELLS, O, SYMBOLS, X, Position
+from gamelog import GameLog
+from openingbook import load as load_book
+from solver import load as load_solver
+
+DEFAULT_AGENT = 'mc'
+DEFAULT_DEADLINE_MS = 250
+DEADLINE_MARGIN = 0.02  # seconds kept back from the search budget for pickling and scheduling
+
+
+# Parse a 9-character board string into a Position with 'O' to move
+def parse_board(text):
+    text = text.replace('.', ' ')
+    if len(text) != NUM_CELLS or set(text) - {' ', 'X', 'O'}:
+        raise ValueError(f"board must be {NUM_CELLS} characters of 'X', 'O' and ' '")
+    board = [list(text[row * 3:row * 3 + 3]) for row in range(3)]
+    return Position.from_board(board, turn=O)
+
+def format_board(position):
+    return ''.join(''.join(row) for row in position.to_board())
+
+# Agent parameters for serving: anytime search that stops at the deadline, no shared caches and no learning from the games
+SERVER_PARAMS = {
+    'mc': {'table': None},
+    'sparse': {'depth': 9},
+    'mcts': {'iterations': None},
+    'td': {'exploration_param': 0, 'learn': False},
+}
+
+# Worker: choose the 'O' cell for `text` before `deadline` (a `time.monotonic` time), drawing from the request's own `seed_sequence`
+# The budget is taken when the worker starts, so time spent queued behind other requests in a busy pool is not searched again
+def decide(text, agent, deadline, seed_sequence):
+    rng = np.random.default_rng(seed_sequence)
+    time_budget = max(0.0, deadline - time.monotonic() - DEADLINE_MARGIN)
+    return make_agent(agent, **SERVER_PARAMS.get(agent, {})).select_move(parse_board(text), time_budget, rng)
+
+# Worker initializer: import the agents and load their tables before the first deadline-bound request
+# (the server builds the tables before it starts the pool, so the workers only read finished files)
+def preload():
+    for module in ('monteclaro', 'sparsesampling', 'temporallearning', 'mcts'):
+        importlib.import_module(module)
+    load_solver()
+    load_book()
+
+
+class GameServer:
+    # Every request gets its own child of the `seed` SeedSequence, so concurrent games never share a random stream
+    def __init__(self, workers=None, default_agent=DEFAULT_AGENT, default_deadline_ms=DEFAULT_DEADLINE_MS, log_path=None, seed=None):
+        self.workers = workers or os.cpu_count()
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+        # Build any missing table once here, before the workers start and load them all at the same time
+        load_solver()
+        load_book()
+        self.pool = ProcessPoolExecutor(self.workers, initializer=preload)
+        self.default_agent = default_agent
+        self.default_deadline_ms = default_deadline_ms
+        self.log = GameLog(log_path) if log_path else None
+        self.games = {}  # game id -> (Position, agent, cells played, lock held while a move is in progress)
+        self.game_ids = itertools.count(1)
+        self.server = None
+        self.connections = {}  # writer -> handler task
+
+    async def start(self, host='127.0.0.1', port=8765):
+        # Start every worker (and run `preload` in it) before accepting games, so no request pays for process start-up
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, time.sleep, 0.05) for _ in range(self.workers)))
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            # Closing a connection makes its handler's next read return end of file, so the handler finishes instead of being cancelled
+            for writer in self.connections:
+                writer.close()
+            await asyncio.gather(*self.connections.values())
+            await self.server.wait_closed()
+        if self.log is not None:
+            self.log.close()
+        self.pool.shutdown(cancel_futures=True)
+
+    # Computer move for `position` within `deadline_ms`; returns (cell, timed_out)
+    async def choose_move(self, position, agent, deadline_ms):
+        if agent not in AGENTS:
+            raise ValueError(f"unknown agent {agent!r}")
+        timeout = deadline_ms / 1000
+        future = asyncio.get_running_loop().run_in_executor(self.pool, decide, format_board(position), agent, time.monotonic() + timeout,
+                                                           self.seed_sequence.spawn(1)[0])
+        try:
+            return await asyncio.wait_for(future, timeout), False
+        except asyncio.TimeoutError:
+            moves = position.legal_moves()
+            return moves[self.rng.integers(len(moves))], True
+
+    async def dispatch(self, request):
+        op = request.get('op')
+        deadline_ms = float(request.get('deadline_ms', self.default_deadline_ms))
+
+        if op == 'decide':
+            position = parse_board(request['board'])
+            if position.is_terminal():
+                raise ValueError("the game is already over")
+            start = time.perf_counter()
+            cell, timed_out = await self.choose_move(position, request.get('agent', self.default_agent), deadline_ms)
+            return {'move': cell, 'timed_out': timed_out, 'elapsed_ms': 1000 * (time.perf_counter() - start)}
+
+        if op == 'new':
+            agent = request.get('agent', self.default_agent)
+            if agent not in AGENTS:
+                raise ValueError(f"unknown agent {agent!r}")
+            game = next(self.game_ids)
+            self.games[game] = (Position(turn=X), agent, [], asyncio.Lock())
+            return {'game': game, 'board': format_board(self.games[game][0])}
+
+        if op == 'play':
+            if request.get('game') not in self.games:
+                raise ValueError(f"unknown game {request.get('game')!r}")
+            position, agent, moves, lock = self.games[request['game']]
+            cell = int(request['cell'])
+            # One move per game at a time: a second `play` waits until the computer has answered the first
+            async with lock:
+                if position.is_terminal() or position.turn != X or cell not in position.legal_moves():
+                    raise ValueError(f"illegal move {cell}")
+                position.play(cell)
+                moves.append(cell)
+                response = {'move': None, 'timed_out': False}
+                if not position.is_terminal():
+                    response['move'], response['timed_out'] = await self.choose_move(position, agent, deadline_ms)
+                    position.play(response['move'])
+                    moves.append(response['move'])
+                winner = position.winner()
+                if self.log is not None and position.is_terminal():
+                    self.log.write(moves, winner, 'human', agent)
+                response.update(board=format_board(position), winner=None if winner is None else SYMBOLS[winner],
+                                over=bool(position.is_terminal()))
+                return response
+
+        if op == 'close':
+            return {'closed': self.games.pop(request['game'], None) is not None}
+
+        raise ValueError(f"unknown op {op!r}")
+
+    # Requests on one connection are answered concurrently, each response tagged with its request's id
+    async def handle_connection(self, reader, writer):
+        self.connections[writer] = asyncio.current_task()
+        lock = asyncio.Lock()
+
+        async def respond(request):
+            try:
+                response = await self.dispatch(request)
+            except (KeyError, TypeError, ValueError) as error:
+                response = {'error': str(error)}
+            if 'id' in request:
+                response['id'] = request['id']
+            async with lock:
+                writer.write((json.dumps(response) + '\n').encode())
+                await writer.drain()
+
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as error:
+                    request = {'op': None, 'error': str(error)}
+                if not isinstance(request, dict):
+                    request = {'op': None}
+                task = asyncio.create_task(respond(request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        finally:
+            del self.connections[writer]
+            writer.close()
+
+
+# Asyncio client for the line protocol; requests may be awaited concurrently
+class Client:
+    def __init__(self):
+        self.reader = self.writer = None
+        self.pending = {}
+        self.request_ids = itertools.count(1)
+        self.listener = None
+
+    async def connect(self, host='127.0.0.1', port=8765):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.listener = asyncio.create_task(self._listen())
+        return self
+
+    async def _listen(self):
+        while line := await self.reader.readline():
+            response = json.loads(line)
+            future = self.pending.pop(response.pop('id', None), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+
+    async def request(self, **request):
+        request['id'] = next(self.request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request['id']] = future
+        self.writer.write((json.dumps(request) + '\n').encode())
+        await self.writer.drain()
+        return await future
+
+    async def new_game(self, agent=DEFAULT_AGENT):
+        return (await self.request(op='new', agent=agent))['game']
+
+    async def play(self, game, cell, deadline_ms=DEFAULT_DEADLINE_MS):
+        return await self.request(op='play', game=game, cell=cell, deadline_ms=deadline_ms)
+
+    async def decide(self, board, agent=DEFAULT_AGENT, deadline_ms=DEFAULT_DEADLINE_MS):
+        return await self.request(op='decide', board=board, agent=agent, deadline_ms=deadline_ms)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        if self.listener is not None:
+            self.listener.cancel()
+
+
+# Play `games` games at once against the server with a random 'X' player and report the move latencies
+async def demo(games=8, agent=DEFAULT_AGENT, deadline_ms=DEFAULT_DEADLINE_MS, workers=None, seed=None):
+    server = GameServer(workers, seed=seed)
+    rng = np.random.default_rng(seed)
+    port = await server.start(port=0)
+    client = await Client().connect(port=port)
+    latencies = []
+    timeouts = 0
+
+    async def play_one():
+        nonlocal timeouts
+        game = await client.new_game(agent)
+        board = ' ' * NUM_CELLS
+        response = {'over': False}
+        while not response['over']:
+            empty = [cell for cell in range(NUM_CELLS) if board[cell] == ' ']
+            cell = empty[rng.integers(len(empty))]
+            start = time.perf_counter()
+            response = await client.play(game, cell, deadline_ms)
+            latencies.append(time.perf_counter() - start)
+            timeouts += response['timed_out']
+            board = response['board']
+        await client.request(op='close', game=game)
+        return response['winner']
+
+    try:
+        winners = await asyncio.gather(*(play_one() for _ in range(games)))
+    finally:
+        await client.close()
+        await server.stop()
+    latencies.sort()
+    print(f"{games} games against {agent}: O wins {winners.count('O')}, X wins {winners.count('X')}, draws {winners.count(None)}")
+    print(f"Move latency p50 {1000 * latencies[len(latencies) // 2]:.1f} ms, max {1000 * latencies[-1]:.1f} ms (deadline {deadline_ms} ms), {timeouts} moves past the deadline")
+
+async def serve(host, port, workers, agent, deadline_ms, log_path=None, seed=None):
+    server = GameServer(workers, agent, deadline_ms, log_path, seed)
+    port = await server.start(host, port)
+    print(f"Serving Tic-Tac-Toe on {host}:{port}")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Asyncio Tic-Tac-Toe game server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--agent', default=DEFAULT_AGENT, choices=AGENTS, help="default agent for new games")
+    parser.add_argument('--deadline-ms', type=float, default=DEFAULT_DEADLINE_MS, help="default per-move deadline")
+    parser.add_argument('--log', help="append every finished game to this game log")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--demo', action='store_true', help="play a few concurrent games against an in-process server and exit")
+    args = parser.parse_args()
+
+    if args.demo:
+        asyncio.run(demo(agent=args.agent, deadline_ms=args.deadline_ms, workers=args.workers, seed=args.seed))
+    else:
+        asyncio.run(serve(args.host, args.port, args.workers, args.agent, args.deadline_ms, args.log, args.seed))
@@ -0,0 +1,118 @@
+"""
+Script Name: Perfect-Play Solver for Tic-Tac-Toe
+Description: This script solves every reachable Tic-Tac-Toe position with negamax and stores the game-theoretic value and best move of each one in a compact binary table that the agents load with numpy.memmap.
+Date: October 18, 2026
+"""
+
+# The table has two rows (X to move, O to move) of 3^9 = 19,683 entries indexed by the base-3 encoding of the board (`Position.index`).
+# Each entry is two signed bytes: the value for the player to move (1 win, 0 draw, -1 loss) and the best cell to play (-1 when the game is over).
+# Positions that cannot be reached from an empty board with either player starting are marked with value UNKNOWN.
+
+# Among moves of equal value the solver prefers the fastest win and the slowest loss.
+
+# Run `python solver.py` to (re)build the table. `load` builds it on first use if the file is missing or has the wrong size.
+# The table is written to a temporary file and renamed into place, so processes that load it at the same time never map a partly written file.
+
+# The table is used by the optimal-play agent (`optimal_move`) and to measure the regret of an agent's move against perfect play (`move_regret`).
+
+
+import os
+import tempfile
+import numpy as np
+from engine import NUM_STATES, O, X, Position, cell_to_move, has_won
+from instrument import count, decision
+
+VALUES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tictactoe_values.bin')
+TABLE_DTYPE = np.dtype([('value', 'i1'), ('move', 'i1')])
+UNKNOWN = -128
+
+_table = None
+
+
+# Solve the whole game and return the (2, 3^9) value table
+def solve():
+    table = np.zeros((2, NUM_STATES), dtype=TABLE_DTYPE)
+    table['value'] = UNKNOWN
+    table['move'] = -1
+    scores = {}
+
+    # Score for the player to move: +/-(1 + empty cells left) for a win/loss, 0 for a draw
+    def negamax(position):
+        key = position.key()
+        if key in scores:
+            return scores[key]
+        best_score, best_cell = None, -1
+        empty = len(position.legal_moves())
+        if has_won(position.bits[position.turn ^ 1]):
+            best_score = -(1 + empty)
+        elif empty == 0:
+            best_score = 0
+        else:
+            for cell in position.legal_moves():
+                position.play(cell)
+                score = -negamax(position)
+                position.undo(cell)
+                if best_score is None or score > best_score:
+                    best_score, best_cell = score, cell
+        scores[key] = best_score
+        table['value'][position.turn, position.index()] = np.sign(best_score)
+        table['move'][position.turn, position.index()] = best_cell
+        return best_score
+
+    negamax(Position(turn=X))
+    negamax(Position(turn=O))
+    return table
+
+# Solve the game and write the table to `path`
+def build(path=VALUES_PATH):
+    table = solve()
+    descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            table.tofile(file)
+        os.chmod(temporary_path, 0o644)  # mkstemp creates the file readable by its owner only
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+    return table
+
+# Memory-map the table, building it first if the file does not exist or is not a whole table
+def load(path=VALUES_PATH):
+    global _table
+    if _table is None or path != VALUES_PATH:
+        if not os.path.exists(path) or os.path.getsize(path) != 2 * NUM_STATES * TABLE_DTYPE.itemsize:
+            build(path)
+        table = np.memmap(path, dtype=TABLE_DTYPE, mode='r', shape=(2, NUM_STATES))
+        if path != VALUES_PATH:
+            return table
+        _table = table
+    return _table
+
+# (value, best cell) for the player to move in `position`
+def lookup(position):
+    entry = load()[position.turn, position.index()]
+    return int(entry['value']), int(entry['move'])
+
+# Perfect-play agent: return the best (row, col) for `player` on a list board
+# The choice is deterministic; `rng` is accepted so that every agent can be called the same way
+@decision('optimal')
+def optimal_move(board, player='O', rng=None):
+    position = Position.from_board(board, turn=O if player == 'O' else X)
+    count('value_lookups')
+    return cell_to_move(lookup(position)[1])
+
+# How much worse playing `cell` is than perfect play, in game values (0 for an optimal move, at most 2)
+def move_regret(position, cell):
+    best_value = lookup(position)[0]
+    position.play(cell)
+    move_value = -lookup(position)[0]
+    position.undo(cell)
+    return best_value - move_value
+
+
+if __name__ == "__main__":
+    table = build()
+    solved = table['value'] != UNKNOWN
+    print(f"Solved {solved.sum()} positions, written to {VALUES_PATH}")
+    print(f"Value of the empty board with X to move: {table[X, 0]['value']}")
@@ -7,178 +7,115 @@ Date: April 26, 2024
 
 # This script defines functions to draw the Tic-Tac-Toe board, handle player moves, and employ a sparse sampling algorithm for the computer's moves. It also evaluates game outcomes and displays performance metrics over multiple games.
 
-# The game interface is built using Pygame, and the algorithmic strategy is based on sparse sampling, which involves evaluating potential moves probabilistically to determine the optimal play for the computer player.
+# The game interface is built using Pygame (in `ui.py`, loaded only when `main()` runs), and the algorithmic strategy is based on sparse sampling, which involves evaluating potential moves probabilistically to determine the optimal play for the computer player.
 
 # To run the game, execute the main.py script. The computer (O) will play against the human player (X), and game outcomes will be displayed in the console. After a series of games, average evaluation metrics and an efficiency plot will be shown.
 
-# Note: Ensure that Pygame and matplotlib are installed to run this script successfully.
+# Note: Ensure that Pygame and matplotlib are installed to play interactively; the algorithm itself only needs NumPy.
 
 
 import numpy as np
-import random
-import pygame
-import sys
-import matplotlib.pyplot as plt
-
-# Define constants
-WIDTH, HEIGHT = 300, 300
-LINE_WIDTH = 15
-BOARD_ROWS, BOARD_COLS = 3, 3
-SQUARE_SIZE = WIDTH // BOARD_ROWS
-WHITE = (255, 255, 255)
-LINE_COLOR = (23, 145, 135)
-BOARD_COLOR = (44, 44, 44)
-X_COLOR = (66, 66, 255)
-O_COLOR = (255, 66, 66)
-
-# Initialize Pygame
-pygame.init()
-
-# Set up the screen
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Tic Tac Toe")
-screen.fill(WHITE)
-
-# Draw lines
-def draw_lines():
-    # Horizontal lines
-    pygame.draw.line(screen, LINE_COLOR, (0, SQUARE_SIZE), (WIDTH, SQUARE_SIZE), LINE_WIDTH)
-    pygame.draw.line(screen, LINE_COLOR, (0, 2 * SQUARE_SIZE), (WIDTH, 2 * SQUARE_SIZE), LINE_WIDTH)
-    # Vertical lines
-    pygame.draw.line(screen, LINE_COLOR, (SQUARE_SIZE, 0), (SQUARE_SIZE, HEIGHT), LINE_WIDTH)
-    pygame.draw.line(screen, LINE_COLOR, (2 * SQUARE_SIZE, 0), (2 * SQUARE_SIZE, HEIGHT), LINE_WIDTH)
-
-# Draw X and O symbols
-def draw_symbols(board):
-    for row in range(BOARD_ROWS):
-        for col in range(BOARD_COLS):
-            if board[row][col] == 'X':
-                pygame.draw.line(screen, X_COLOR, (col * SQUARE_SIZE + SQUARE_SIZE // 4, row * SQUARE_SIZE + SQUARE_SIZE // 4), 
-                                 ((col + 1) * SQUARE_SIZE - SQUARE_SIZE // 4, (row + 1) * SQUARE_SIZE - SQUARE_SIZE // 4), LINE_WIDTH)
-                pygame.draw.line(screen, X_COLOR, ((col + 1) * SQUARE_SIZE - SQUARE_SIZE // 4, row * SQUARE_SIZE + SQUARE_SIZE // 4), 
-                                 (col * SQUARE_SIZE + SQUARE_SIZE // 4, (row + 1) * SQUARE_SIZE - SQUARE_SIZE // 4), LINE_WIDTH)
-            elif board[row][col] == 'O':
-                pygame.draw.circle(screen, O_COLOR, (col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2), SQUARE_SIZE // 4, LINE_WIDTH)
-
-# Check for winner
-def check_winner(board, player):
-    # Check rows
-    for row in range(BOARD_ROWS):
-        if all([board[row][col] == player for col in range(BOARD_COLS)]):
-            return True
-    # Check columns
-    for col in range(BOARD_COLS):
-        if all([board[row][col] == player for row in range(BOARD_ROWS)]):
-            return True
-    # Check diagonals
-    if all([board[i][i] == player for i in range(BOARD_ROWS)]) or all([board[i][BOARD_COLS - i - 1] == player for i in range(BOARD_ROWS)]):
-        return True
-    return False
-
-# Check for tie
-def check_tie(board):
-    return all([board[row][col] != ' ' for row in range(BOARD_ROWS) for col in range(BOARD_COLS)])
-
-# Sparse sampling algorithm
-def sparse_sampling(board, exploration_param=0.1):
-    moves = [(row, col) for row in range(BOARD_ROWS) for col in range(BOARD_COLS) if board[row][col] == ' ']
-    scores = np.zeros(len(moves))
-
-    for i, move in enumerate(moves):
-        new_board = [row[:] for row in board]
-        new_board[move[0]][move[1]] = 'O'  # Assume computer is 'O'
-        scores[i] = np.random.uniform(0, exploration_param) + evaluate(new_board, 'O')['score']
-
-    best_move = moves[np.argmax(scores)]
+import time
+from collections import Counter
+from engine import O, X, Position, cell_to_move, has_won
+from instrument import count, decision
+from openingbook import book_move
+from seeding import get_rng, scalar_random
+from symmetry import canonical_index, shared_table
+
+# Sparse sampling algorithm (Kearns, Mansour & Ng)
+# 'O' looks `depth` of its own moves ahead. After each 'O' move the opponent's reply is sampled `width` times,
+# and the value of a position is the best sampled move value (win 1, draw 0, loss -1, discounted per move).
+# Values are memoized by (canonical position, depth) in the shared transposition table, so a subtree reached through different
+# move orders, or a symmetric copy of it, is only computed once.
+# With a `time_budget` (seconds) the search is anytime: it deepens one level at a time up to `depth` and returns the best move of the
+# deepest level that finished before the budget ran out.
+# Early positions are answered from the opening book unless `book` is False.
+@decision('sparse')
+def sparse_sampling(board, exploration_param=0.1, depth=4, width=3, discount_factor=0.95, cache=shared_table, time_budget=None, book=True, rng=None):
+    rng = get_rng(rng)
+    position = Position.from_board(board, turn=O)  # Assume computer is 'O'
+    cell = book_move(position, rng) if book else None
+    if cell is not None:
+        return cell_to_move(cell)
+    if cache is None:
+        cache = {}
+    moves = position.legal_moves()
+    sampler = scalar_random(rng)
+    tally = Counter()  # work counters of this decision, reported once at the end
+
+    if time_budget is None:
+        scores = root_scores(position, moves, depth, width, discount_factor, cache, sampler, tally)
+    else:
+        # An interrupted level leaves `position` part-way down the tree, so each level searches a copy
+        deadline = time.perf_counter() + time_budget
+        scores = root_scores(position, moves, 1, width, discount_factor, cache, sampler, tally)
+        for horizon in range(2, depth + 1):
+            try:
+                scores = root_scores(position.copy(), moves, horizon, width, discount_factor, cache, sampler, tally, deadline)
+            except SearchTimeout:
+                break
+    for name, value in tally.items():
+        count(name, value)
+
+    scores += rng.uniform(0, exploration_param, len(moves))
+    best_move = cell_to_move(moves[np.argmax(scores)])
     return best_move
 
-# Evaluation function
-def evaluate(board, player):
-    # Return evaluation criteria for the game
-    return {
-        'No. of Episodes': random.randint(50, 150),
-        'Regret': random.uniform(0, 1),
-        'Average Total Rewards per Episode': random.uniform(0, 1),
-        'Win Rate': random.uniform(0, 1),
-        'Efficiency': random.uniform(0, 1),
-        'score': random.uniform(0, 1)  # Ensure 'score' key is present
-    }
+# Raised inside the search when an anytime deadline has passed
+class SearchTimeout(Exception):
+    pass
+
+# Sampled values of every root move with `depth` moves of lookahead; `sampler` is the random.Random the replies are drawn with
+# and `tally` a Counter the search adds its work counters to
+def root_scores(position, moves, depth, width, discount_factor, cache, sampler, tally, deadline=None):
+    return np.array([q_value(position, cell, depth, width, discount_factor, cache, sampler, tally, deadline) for cell in moves])
+
+# Sampled value of 'O' playing `cell` in `position`
+def q_value(position, cell, depth, width, discount_factor, cache, sampler, tally, deadline=None):
+    position.play(cell)
+    tally['win_checks'] += 1
+    if has_won(position.bits[O]):
+        value = 1.0
+    elif position.is_full():
+        value = 0.0
+    else:
+        replies = position.legal_moves()
+        total = 0.0
+        for _ in range(width):
+            reply = replies[sampler.randrange(len(replies))]
+            position.play(reply)
+            if has_won(position.bits[X]):
+                total -= 1.0
+            elif not position.is_full():
+                total += discount_factor * state_value(position, depth - 1, width, discount_factor, cache, sampler, tally, deadline)
+            position.undo(reply)
+        tally['win_checks'] += width
+        value = total / width
+    position.undo(cell)
+    return value
+
+# Value of a position with 'O' to move and `depth` moves of lookahead left
+def state_value(position, depth, width, discount_factor, cache, sampler, tally, deadline=None):
+    if depth == 0:
+        return 0.0
+    key = ('ss', canonical_index(position.bits[X], position.bits[O]), depth, width, discount_factor)
+    value = cache.get(key)
+    if value is None:
+        if deadline is not None and time.perf_counter() > deadline:
+            raise SearchTimeout
+        tally['cache_misses'] += 1
+        tally['nodes_expanded'] += 1
+        value = max(q_value(position, cell, depth, width, discount_factor, cache, sampler, tally, deadline) for cell in position.legal_moves())
+        cache[key] = value
+    else:
+        tally['cache_hits'] += 1
+    return value
 
 # Main game loop
 def main():
-    evaluation_results = []
-    efficiency_values = []
-
-    for game in range(5):
-        board = [[' ' for _ in range(BOARD_COLS)] for _ in range(BOARD_ROWS)]
-        game_over = False
-        turn = random.choice(['X', 'O'])
-
-        while not game_over:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN and turn == 'X':
-                    x, y = pygame.mouse.get_pos()
-                    row = y // SQUARE_SIZE
-                    col = x // SQUARE_SIZE
-                    if board[row][col] == ' ':
-                        board[row][col] = turn
-                        if check_winner(board, turn):
-                            print(f"Player {turn} wins!")
-                            game_over = True
-                        elif check_tie(board):
-                            print("It's a tie!")
-                            game_over = True
-                        turn = 'O'
-                    else:
-                        print("Invalid move. Try again.")
-
-            if turn == 'O' and not game_over:
-                row, col = sparse_sampling(board)
-                board[row][col] = turn
-                if check_winner(board, turn):
-                    print(f"Player {turn} wins!")
-                    game_over = True
-                elif check_tie(board):
-                    print("It's a tie!")
-                    game_over = True
-                turn = 'X'
-
-            screen.fill(WHITE)
-            draw_lines()
-            draw_symbols(board)
-            pygame.display.update()
-
-        # Collect evaluation criteria for the game
-        evaluation_results.append(evaluate(board, 'O'))
-        efficiency_values.append(evaluation_results[-1]['Efficiency'])
-
-        # Print evaluation criteria for the current game
-        print(f"--- Evaluation Results for Game {game + 1} ---")
-        print(evaluation_results[-1])
-
-    # Calculate average evaluation results after 5 games
-    avg_win_rate = np.mean([result['Win Rate'] for result in evaluation_results])
-    avg_avg_total_rewards = np.mean([result['Average Total Rewards per Episode'] for result in evaluation_results])
-    avg_efficiency = np.mean([result['Efficiency'] for result in evaluation_results])
-
-    print("\nAverage Evaluation Results after 5 games:")
-    print(f"Average Win Rate: {avg_win_rate}")
-    print(f"Average Average Total Rewards per Episode: {avg_avg_total_rewards}")
-    print(f"Average Efficiency: {avg_efficiency}")
-
-    # Plot efficiency values
-    plt.plot(range(1, 6), efficiency_values, marker='o')
-    plt.title('Efficiency of the Algorithm over 5 Games')
-    plt.xlabel('Game Number')
-    plt.ylabel('Efficiency')
-    plt.grid(True)
-    plt.show()
-
-    return efficiency_values
+    from ui import play_and_report
+    return play_and_report('sparse', 'Sparse Sampling')
 
 
 if __name__ == "__main__":
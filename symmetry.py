@@ -0,0 +1,115 @@
+"""
+Script Name: Board Symmetries and Transposition Table for Tic-Tac-Toe
+Description: This module maps positions to a canonical form under the 8 symmetries of the board and provides a bounded LRU transposition table shared by the agents.
+Date: October 18, 2026
+"""
+
+# The board has 8 symmetries: 4 rotations, each with or without a mirror. Every position is mapped to the symmetric form with the smallest base-3 index (`Position.index`),
+# which cuts the 5,478 legal positions down to 765 essential ones.
+
+# `canonical(x_bits, o_bits)` returns the canonical bit masks and the symmetry used; `to_canonical_cell` and `from_canonical_cell` move a cell between the original and the canonical orientation,
+# so a move found on the canonical board can be played on the original one.
+
+# `canonical_arrays()` gives the canonical index and symmetry of all 3^9 base-3 indices as NumPy arrays, for looking up whole batches of boards at once.
+
+# `TranspositionTable` is a bounded LRU cache with hit/miss counters. `shared_table` is the instance that `monte_carlo_rollout` and `sparse_sampling` store their results in;
+# `td_learning` indexes its value table by canonical state.
+
+
+from collections import OrderedDict
+import numpy as np
+from engine import BOARD_ROWS, BOARD_COLS, NUM_CELLS, NUM_STATES, TERNARY, iter_bits
+
+
+# Cell permutation for one symmetry: rotate `rotations` quarter turns, then mirror left-right if `mirror`
+def _permutation(rotations, mirror):
+    permutation = []
+    for cell in range(NUM_CELLS):
+        row, col = divmod(cell, BOARD_COLS)
+        for _ in range(rotations):
+            row, col = col, BOARD_ROWS - 1 - row
+        if mirror:
+            col = BOARD_COLS - 1 - col
+        permutation.append(row * BOARD_COLS + col)
+    return tuple(permutation)
+
+# SYMMETRIES[s][cell] is where `cell` goes under symmetry s; INVERSES[s] undoes it
+SYMMETRIES = tuple(_permutation(rotations, mirror) for mirror in (False, True) for rotations in range(4))
+INVERSES = tuple(tuple(permutation.index(cell) for cell in range(NUM_CELLS)) for permutation in SYMMETRIES)
+
+# PERMUTED_BITS[s][bits] is the bit mask `bits` moved by symmetry s
+PERMUTED_BITS = tuple(tuple(sum(1 << permutation[cell] for cell in iter_bits(bits)) for bits in range(1 << NUM_CELLS))
+                      for permutation in SYMMETRIES)
+
+
+# Canonical form of a position: (x bits, o bits, symmetry) with the smallest base-3 index
+def canonical(x_bits, o_bits):
+    best = None
+    for symmetry, permuted in enumerate(PERMUTED_BITS):
+        x, o = permuted[x_bits], permuted[o_bits]
+        index = TERNARY[x] + 2 * TERNARY[o]
+        if best is None or index < best[0]:
+            best = (index, x, o, symmetry)
+    return best[1], best[2], best[3]
+
+# Base-3 index of the canonical form of a position
+def canonical_index(x_bits, o_bits):
+    return min(TERNARY[permuted[x_bits]] + 2 * TERNARY[permuted[o_bits]] for permuted in PERMUTED_BITS)
+
+# Move a cell from the original orientation to the canonical one, and back
+def to_canonical_cell(cell, symmetry):
+    return SYMMETRIES[symmetry][cell]
+
+def from_canonical_cell(cell, symmetry):
+    return INVERSES[symmetry][cell]
+
+# (canonical index, symmetry) arrays over every base-3 index, built on first use
+_canonical_arrays = None
+
+def canonical_arrays():
+    global _canonical_arrays
+    if _canonical_arrays is None:
+        powers = 3 ** np.arange(NUM_CELLS)
+        digits = np.arange(NUM_STATES)[:, None] // powers % 3
+        # The board moved by symmetry s has in cell j the digit of cell INVERSES[s][j]
+        indices = np.stack([digits[:, list(inverse)] @ powers for inverse in INVERSES], axis=1)
+        _canonical_arrays = (indices.min(axis=1).astype(np.int32), indices.argmin(axis=1).astype(np.int8))
+    return _canonical_arrays
+
+
+# Bounded least-recently-used cache
+# It keeps its own hit and miss tallies; the agents report their cache hits and misses to the instrumentation once per decision
+class TranspositionTable:
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return default
+
+    def __setitem__(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+
+# Transposition table shared by the agents; keys start with the agent's tag
+shared_table = TranspositionTable()
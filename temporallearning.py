@@ -7,193 +7,142 @@ Date: April 26, 2024
 
 # This script defines functions to draw the Tic-Tac-Toe board, handle player moves, and utilize TD learning for the computer's moves. Game outcomes are evaluated based on various criteria, and performance metrics are displayed after a series of games.
 
-# The game interface is built using Pygame for graphical display, and matplotlib is used to visualize the efficiency of the algorithm over multiple games.
+# The game interface is built using Pygame for graphical display, and matplotlib is used to visualize the efficiency of the algorithm over multiple games. Both live in `ui.py` and are only loaded when `main()` runs, so the algorithm can be imported without a display.
 
 # To run the game, execute the main.py script. The computer (O) will play against the human player (X), and game outcomes will be displayed in the console. After a series of games, average evaluation metrics and an efficiency plot will be shown.
 
-# Note: Ensure that Pygame and matplotlib are installed to run this script successfully.
-
-
-
-
-import numpy as np
-import random
-import pygame
-import sys
-import matplotlib.pyplot as plt
-
-# Define constants
-WIDTH, HEIGHT = 300, 300
-LINE_WIDTH = 15
-BOARD_ROWS, BOARD_COLS = 3, 3
-SQUARE_SIZE = WIDTH // BOARD_ROWS
-WHITE = (255, 255, 255)
-LINE_COLOR = (23, 145, 135)
-BOARD_COLOR = (44, 44, 44)
-X_COLOR = (66, 66, 255)
-O_COLOR = (255, 66, 66)
-
-# Initialize Pygame
-pygame.init()
-
-# Set up the screen
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Tic Tac Toe")
-screen.fill(WHITE)
-
-# Draw lines
-def draw_lines():
-    # Horizontal lines
-    pygame.draw.line(screen, LINE_COLOR, (0, SQUARE_SIZE), (WIDTH, SQUARE_SIZE), LINE_WIDTH)
-    pygame.draw.line(screen, LINE_COLOR, (0, 2 * SQUARE_SIZE), (WIDTH, 2 * SQUARE_SIZE), LINE_WIDTH)
-    # Vertical lines
-    pygame.draw.line(screen, LINE_COLOR, (SQUARE_SIZE, 0), (SQUARE_SIZE, HEIGHT), LINE_WIDTH)
-    pygame.draw.line(screen, LINE_COLOR, (2 * SQUARE_SIZE, 0), (2 * SQUARE_SIZE, HEIGHT), LINE_WIDTH)
-
-# Draw X and O symbols
-def draw_symbols(board):
-    for row in range(BOARD_ROWS):
-        for col in range(BOARD_COLS):
-            if board[row][col] == 'X':
-                pygame.draw.line(screen, X_COLOR, (col * SQUARE_SIZE + SQUARE_SIZE // 4, row * SQUARE_SIZE + SQUARE_SIZE // 4), 
-                                 ((col + 1) * SQUARE_SIZE - SQUARE_SIZE // 4, (row + 1) * SQUARE_SIZE - SQUARE_SIZE // 4), LINE_WIDTH)
-                pygame.draw.line(screen, X_COLOR, ((col + 1) * SQUARE_SIZE - SQUARE_SIZE // 4, row * SQUARE_SIZE + SQUARE_SIZE // 4), 
-                                 (col * SQUARE_SIZE + SQUARE_SIZE // 4, (row + 1) * SQUARE_SIZE - SQUARE_SIZE // 4), LINE_WIDTH)
-            elif board[row][col] == 'O':
-                pygame.draw.circle(screen, O_COLOR, (col * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2), SQUARE_SIZE // 4, LINE_WIDTH)
-
-# Check for winner
-def check_winner(board, player):
-    # Check rows
-    for row in range(BOARD_ROWS):
-        if all([board[row][col] == player for col in range(BOARD_COLS)]):
-            return True
-    # Check columns
-    for col in range(BOARD_COLS):
-        if all([board[row][col] == player for row in range(BOARD_ROWS)]):
-            return True
-    # Check diagonals
-    if all([board[i][i] == player for i in range(BOARD_ROWS)]) or all([board[i][BOARD_COLS - i - 1] == player for i in range(BOARD_ROWS)]):
-        return True
-    return False
-
-# Check for tie
-def check_tie(board):
-    return all([board[row][col] != ' ' for row in range(BOARD_ROWS) for col in range(BOARD_COLS)]) and not check_winner(board, 'X') and not check_winner(board, 'O')
-
-# Temporal Difference Learning algorithm
-def td_learning(board, exploration_param=0.1, learning_rate=0.1, discount_factor=0.9):
-    moves = [(row, col) for row in range(BOARD_ROWS) for col in range(BOARD_COLS) if board[row][col] == ' ']
-
-    # Choose the move with the highest estimated value
-    best_value = float('-inf')
-    best_move = None
-    for move in moves:
-        new_board = [row[:] for row in board]
-        new_board[move[0]][move[1]] = 'O'  # Assume computer is 'O'
-        value = evaluate(new_board, 'O')['score']
-        if value > best_value:
-            best_value = value
-            best_move = move
-
-    # Update the evaluation function using TD learning
-    if best_move is not None:
-        new_board = [row[:] for row in board]
-        new_board[best_move[0]][best_move[1]] = 'O'
-        reward = 1 if check_winner(new_board, 'O') else 0
-        updated_value = evaluate(board, 'O')['score'] + learning_rate * (reward + discount_factor * best_value - evaluate(board, 'O')['score'])
-        evaluate(board, 'O')['score'] = updated_value
-
-    return best_move
-
-# Evaluation function
-def evaluate(board, player):
-    # Return evaluation criteria for the game
-    return {
-        'No. of Episodes': random.randint(50, 150),
-        'Regret': random.uniform(0, 1),
-        'Average Total Rewards per Episode': random.uniform(0, 1),
-        'Win Rate': random.uniform(0, 1),
-        'Efficiency': random.uniform(0, 1),
-        'score': random.uniform(0, 1)  # Ensure 'score' key is present
-    }
+# Note: Ensure that Pygame and matplotlib are installed to play interactively; the algorithm itself only needs NumPy.
+
+
+
+
+from agents import Agent
+from engine import O, Position, cell_to_move
+from instrument import count, decision
+from linearvalue import LinearValue
+from seeding import get_rng
+from valuetable import ValueTable
+
+# Learned values of the positions right after 'O' moves (afterstates), kept across games and saved to disk
+value_table = ValueTable.load()
+# The same values approximated from line features (see linearvalue.py), loaded on first use
+linear_value = None
+
+# The module's value function for `backend`: 'table' (the dense value table, 3x3 only) or 'linear' (line features, any board)
+def backend_table(backend='table'):
+    global linear_value
+    if backend == 'table':
+        return value_table
+    if backend == 'linear':
+        if linear_value is None:
+            linear_value = LinearValue.load()
+        return linear_value
+    raise ValueError(f"unknown TD backend {backend!r}")
+
+# Value of the afterstate reached by 'O' playing `cell`: the reward if the game ends, otherwise the learned value
+def afterstate_value(position, cell, table=None):
+    position.play(cell)
+    if position.winner() is not None:
+        value = 1.0
+    elif position.is_full():
+        value = 0.0
+    else:
+        value = (table if table is not None else value_table).value(position)
+    position.undo(cell)
+    return value
+
+# Epsilon-greedy choice among afterstate values; returns the chosen cell and the best value
+@decision('td')
+def td_select(position, exploration_param=0.1, table=None, rng=None):
+    moves = position.legal_moves()
+    if isinstance(table, LinearValue):
+        values = table.afterstate_values(position, moves)
+    else:
+        values = [afterstate_value(position, cell, table) for cell in moves]
+    count('win_checks', len(moves))
+    count('value_lookups', len(moves))
+    best_value = max(values)
+    rng = get_rng(rng)
+    if rng.random() < exploration_param:
+        return moves[rng.integers(len(moves))], best_value
+    return moves[values.index(best_value)], best_value
+
+# Temporal Difference Learning agent
+# The agent plays the move with the highest afterstate value (a random move with probability `exploration_param`),
+# and the previous afterstate is moved towards the discounted value of the new one (TD(0)); when the game ends it is moved towards the final reward
+# (1 win, 0 draw, -1 loss for the agent). Positions where the agent plays 'X' are looked up with the colours swapped.
+# The agent learns into `table` (the module's value function for `backend` by default) unless `learn` is False, and with `save` it saves it after every game.
+# With a `LinearValue` table the agent also plays on an `MNKBoard` of the table's size; the value table needs an engine Position,
+# so other states (the 3x3 `MNKBoard` of the interactive game) are converted to one first.
+class TDAgent(Agent):
+    def __init__(self, exploration_param=0.1, learning_rate=0.1, discount_factor=0.9, table=None, learn=True, save=False, backend='table'):
+        self.exploration_param = exploration_param
+        self.learning_rate = learning_rate
+        self.discount_factor = discount_factor
+        self.table = table
+        self.backend = backend
+        self.learn = learn
+        self.save = save
+        self.side = O
+        self.previous_afterstate = None
+
+    def current_table(self):
+        return self.table if self.table is not None else backend_table(self.backend)
+
+    def select_move(self, state, budget=None, rng=None):
+        self.side = state.turn
+        table = self.current_table()
+        if not isinstance(table, LinearValue) and not isinstance(state, Position):
+            state = Position.from_board(state.to_board(), turn=state.turn)
+        position = state.copy() if state.turn == O else state.swapped()
+        cell, best_value = td_select(position, self.exploration_param, table, rng)
+        if self.learn:
+            if self.previous_afterstate is not None:
+                table.td0_update(self.previous_afterstate, self.discount_factor * best_value, self.learning_rate)
+            position.play(cell)
+            self.previous_afterstate = None if position.is_terminal() else table.state_id(position)
+        return cell
+
+    # Final TD update when the game ends, after either side's move
+    def observe(self, transition):
+        state = transition.state
+        if not state.is_terminal():
+            return
+        if self.learn and self.previous_afterstate is not None:
+            winner = state.winner()
+            reward = 0 if winner is None else 1 if winner == self.side else -1
+            self.current_table().td0_update(self.previous_afterstate, reward, self.learning_rate)
+        self.previous_afterstate = None
+        if self.save:
+            self.current_table().save()
+
+    def reset(self):
+        self.previous_afterstate = None
+
+td_agent = TDAgent()
+
+# Temporal Difference Learning algorithm: the move of `td_agent` for 'O' on a list board
+@decision('td')
+def td_learning(board, exploration_param=0.1, learning_rate=0.1, discount_factor=0.9, rng=None):
+    position = Position.from_board(board, turn=O)  # Assume computer is 'O'
+    if not position.empty():
+        return None
+    td_agent.exploration_param = exploration_param
+    td_agent.learning_rate = learning_rate
+    td_agent.discount_factor = discount_factor
+    return cell_to_move(td_agent.select_move(position, rng=rng))
+
+# Reload the saved values, dropping what was learned since they were saved, and forget the game in progress
+def td_reset():
+    global value_table, linear_value
+    value_table = ValueTable.load()
+    linear_value = None
+    td_agent.reset()
 
 # Main game loop
 def main():
-    evaluation_results = []
-    efficiency_values = []
-
-    for game in range(5):
-        board = [[' ' for _ in range(BOARD_COLS)] for _ in range(BOARD_ROWS)]
-        game_over = False
-        turn = random.choice(['X', 'O'])
-
-        while not game_over:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN and turn == 'X':
-                    x, y = pygame.mouse.get_pos()
-                    row = y // SQUARE_SIZE
-                    col = x // SQUARE_SIZE
-                    if board[row][col] == ' ':
-                        board[row][col] = turn
-                        if check_winner(board, turn):
-                            print(f"Player {turn} wins!")
-                            game_over = True
-                        elif check_tie(board):
-                            print("It's a tie!")
-                            game_over = True
-                        turn = 'O'
-                    else:
-                        print("Invalid move. Try again.")
-
-            if turn == 'O' and not game_over:
-                row, col = td_learning(board)
-                if row is not None and col is not None:
-                    board[row][col] = turn
-                    if check_winner(board, turn):
-                        print(f"Player {turn} wins!")
-                        game_over = True
-                    elif check_tie(board):
-                        print("It's a tie!")
-                        game_over = True
-                    turn = 'X'
-
-            screen.fill(WHITE)
-            draw_lines()
-            draw_symbols(board)
-            pygame.display.update()
-
-        # Collect evaluation criteria for the game
-        evaluation_results.append(evaluate(board, 'O'))
-        efficiency_values.append(evaluation_results[-1]['Efficiency'])
-
-        # Print evaluation criteria for the current game
-        print(f"--- Evaluation Results for Game {game + 1} ---")
-        print(evaluation_results[-1])
-
-    # Calculate average evaluation results after 5 games
-    avg_win_rate = np.mean([result['Win Rate'] for result in evaluation_results])
-    avg_avg_total_rewards = np.mean([result['Average Total Rewards per Episode'] for result in evaluation_results])
-    avg_efficiency = np.mean([result['Efficiency'] for result in evaluation_results])
-
-    print("\nAverage Evaluation Results after 5 games:")
-    print(f"Average Win Rate: {avg_win_rate}")
-    print(f"Average Average Total Rewards per Episode: {avg_avg_total_rewards}")
-    print(f"Average Efficiency: {avg_efficiency}")
-
-    # Plot efficiency values
-    plt.plot(range(1, 6), efficiency_values, marker='o')
-    plt.title('Efficiency of the Algorithm over 5 Games')
-    plt.xlabel('Game Number')
-    plt.ylabel('Efficiency')
-    plt.grid(True)
-    plt.show()
-
-    return efficiency_values
+    from ui import play_and_report
+    return play_and_report('td', 'Temporal Difference Learning', save=True)
 
 
 if __name__ == "__main__":
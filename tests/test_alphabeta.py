@@ -0,0 +1,60 @@
+# Alpha-beta search: its moves keep the solver's game value, and it finds short wins and blocks on larger boards
+
+import numpy as np
+import pytest
+from agents import make_agent, play_game
+from alphabeta import AlphaBetaAgent
+from engine import O, X, Position
+from mnk import MNKBoard
+from solver import move_regret
+
+
+def random_positions(count, seed):
+    rng = np.random.default_rng(seed)
+    positions = []
+    while len(positions) < count:
+        position = Position(turn=(X, O)[rng.integers(2)])
+        for _ in range(rng.integers(8)):
+            moves = position.legal_moves()
+            position.play(moves[rng.integers(len(moves))])
+            if position.is_terminal():
+                break
+        if not position.is_terminal():
+            positions.append(position)
+    return positions
+
+
+def test_moves_keep_the_solver_value():
+    agent = AlphaBetaAgent()
+    for position in random_positions(300, 0):
+        key = position.key()
+        cell = agent.select_move(position)
+        assert position.key() == key
+        assert move_regret(position, cell) == 0, position
+
+
+def test_draws_against_perfect_play():
+    agent, optimal = AlphaBetaAgent(), make_agent('optimal')
+    for first in (X, O):
+        assert play_game(agent, optimal, first=first)[0] is None
+        assert play_game(optimal, agent, first=first)[0] is None
+
+
+def test_depth_limited_search_takes_a_win_and_blocks_one():
+    # On a 6x6 board with k=4, X's three in a row can only be completed at cell 10: O to move must block there, X to move wins there
+    board = [list('      '), list('OXXX  '), list(' O    '), list('      '), list('      '), list('      ')]
+    assert AlphaBetaAgent(max_depth=2).select_move(MNKBoard.from_board(board, k=4, turn=O)) == 10
+    assert AlphaBetaAgent(max_depth=1).select_move(MNKBoard.from_board(board, k=4, turn=X)) == 10
+
+
+def test_time_budget_returns_a_legal_move():
+    state = MNKBoard(9, 9, 5)
+    state.play(40)
+    cell = AlphaBetaAgent(time_budget=0.05).select_move(state)
+    assert cell in state.legal_moves()
+
+
+@pytest.mark.parametrize('board', [[list('XXX'), list('OO '), list('   ')], [list('XOX'), list('XOO'), list('OXX')]])
+def test_finished_position_is_rejected(board):
+    with pytest.raises(ValueError):
+        AlphaBetaAgent().select_move(Position.from_board(board, turn=O))
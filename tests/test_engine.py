@@ -0,0 +1,46 @@
+# Bitboard engine: win detection against a brute-force scan of the board, and play/undo/board round trips
+
+import numpy as np
+from engine import FULL_MASK, NUM_CELLS, O, WIN_LINES, X, Position, has_won
+
+
+def brute_force_won(bits):
+    return any(all(bits >> cell & 1 for cell in line) for line in WIN_LINES)
+
+
+def test_has_won_matches_brute_force_for_every_mask():
+    for bits in range(FULL_MASK + 1):
+        assert bool(has_won(bits)) == brute_force_won(bits)
+
+
+def test_random_games_match_brute_force_and_undo_restores():
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        position = Position(turn=X)
+        played = []
+        while not position.is_terminal():
+            moves = position.legal_moves()
+            assert moves == [cell for cell in range(NUM_CELLS) if not (position.bits[X] | position.bits[O]) >> cell & 1]
+            cell = moves[rng.integers(len(moves))]
+            played.append((position.key(), cell))
+            position.play(cell)
+        winner = position.winner()
+        expected = X if brute_force_won(position.bits[X]) else O if brute_force_won(position.bits[O]) else None
+        assert winner == expected
+        assert position.is_full() or winner is not None
+        for key, cell in reversed(played):
+            position.undo(cell)
+            assert position.key() == key
+        assert position.key() == (0, 0, X)
+
+
+def test_board_round_trip():
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        position = Position(turn=X)
+        for _ in range(rng.integers(NUM_CELLS)):
+            if position.is_terminal():
+                break
+            moves = position.legal_moves()
+            position.play(moves[rng.integers(len(moves))])
+        assert Position.from_board(position.to_board(), turn=position.turn) == position
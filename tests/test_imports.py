@@ -0,0 +1,24 @@
+# Importing the agent modules must not load the UI libraries, and must stay fast enough for worker processes to start quickly
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_BUDGET = 1.0  # seconds for a fresh interpreter to import the three agent modules
+
+CODE = """
+import json, sys, time
+start = time.perf_counter()
+import monteclaro, sparsesampling, temporallearning
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'modules': sorted(name for name in ('pygame', 'matplotlib') if name in sys.modules)}))
+"""
+
+
+def test_agent_imports_are_headless_and_fast():
+    result = subprocess.run([sys.executable, '-c', CODE], cwd=ROOT, capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout)
+    assert report['modules'] == []
+    assert report['seconds'] < IMPORT_BUDGET
@@ -0,0 +1,21 @@
+# MCTS agent: it takes an immediate win and refuses positions where the game is already over
+
+import numpy as np
+import pytest
+from engine import O, Position
+from mcts import MCTSAgent
+
+WON = [list('XXX'), list('OO '), list('   ')]
+FULL = [list('XOX'), list('XOO'), list('OXX')]
+
+
+def test_takes_an_immediate_win():
+    position = Position.from_board([list('OO '), list('XX '), list('X  ')], turn=O)
+    assert MCTSAgent(iterations=2000).select_move(position, rng=np.random.default_rng(0)) == 2
+
+
+@pytest.mark.parametrize('board', [WON, FULL])
+@pytest.mark.parametrize('agent', [MCTSAgent(iterations=10), MCTSAgent(time_budget=0.01)])
+def test_finished_position_is_rejected(board, agent):
+    with pytest.raises(ValueError):
+        agent.select_move(Position.from_board(board, turn=O))
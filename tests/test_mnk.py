@@ -0,0 +1,65 @@
+# m,n,k board: incremental win detection and frontier bookkeeping against recomputation from the cells
+
+import numpy as np
+import pytest
+from engine import O, X, Position
+from mnk import MNKBoard
+
+
+# Player (X or O) with k in a row anywhere on the board, scanning every cell and direction
+def brute_force_winner(state):
+    for row in range(state.rows):
+        for col in range(state.cols):
+            stone = state.cells[row * state.cols + col]
+            if stone == 0:
+                continue
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                cells = [(row + i * dr, col + i * dc) for i in range(state.k)]
+                if all(0 <= r < state.rows and 0 <= c < state.cols and state.cells[r * state.cols + c] == stone for r, c in cells):
+                    return stone - 1
+    return None
+
+def brute_force_frontier(state):
+    stones = [cell for cell in range(len(state.cells)) if state.cells[cell]]
+    return {cell for cell in range(len(state.cells)) if state.cells[cell] == 0 and any(
+        abs(cell // state.cols - stone // state.cols) <= state.radius and abs(cell % state.cols - stone % state.cols) <= state.radius
+        for stone in stones)}
+
+
+@pytest.mark.parametrize('rows, cols, k, radius', [(3, 3, 3, 2), (5, 4, 3, 1), (7, 7, 4, 2)])
+def test_random_games_match_recomputation(rows, cols, k, radius):
+    rng = np.random.default_rng(rows * cols + k)
+    for _ in range(100):
+        state = MNKBoard(rows, cols, k, radius)
+        history = []
+        while not state.is_terminal():
+            cells = state.empty_cells()
+            cell = cells[rng.integers(len(cells))]
+            history.append((state.key(), set(state.frontier), cell))
+            state.play(cell)
+            assert state.winner() == brute_force_winner(state)
+            assert state.frontier == brute_force_frontier(state)
+        for key, frontier, cell in reversed(history):
+            state.undo(cell)
+            assert state.key() == key
+            assert state.frontier == frontier == brute_force_frontier(state)
+
+
+def test_three_by_three_agrees_with_engine():
+    rng = np.random.default_rng(2)
+    for _ in range(300):
+        state, position = MNKBoard(), Position(turn=X)
+        while not position.is_terminal():
+            cells = position.legal_moves()
+            cell = cells[rng.integers(len(cells))]
+            state.play(cell)
+            position.play(cell)
+            assert state.winner() == position.winner()
+            assert state.is_terminal() == bool(position.is_terminal())
+            assert state.to_board() == position.to_board()
+
+
+def test_from_board_finds_a_completed_line():
+    state = MNKBoard.from_board([list('OX '), list('OX '), list('O X')])
+    assert state.winner() == O
+    assert brute_force_winner(state) == O
@@ -0,0 +1,37 @@
+# Opening book: book moves keep the solver value, and a short book file is rebuilt whole even by concurrent loads
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import openingbook
+from engine import O, X, Position
+from solver import move_regret
+
+
+def test_book_moves_keep_the_solver_value():
+    positions = [Position(turn=O)]
+    for cells in ((4,), (0,), (1,), (0, 4, 8)):
+        position = Position(turn=X)
+        for cell in cells:
+            position.play(cell)
+        positions.append(position)
+    for position in positions:
+        cell = openingbook.book_move(position)
+        assert cell is not None
+        assert move_regret(position, cell) == 0
+
+
+def load_size(path):
+    return len(openingbook.load(path))
+
+
+def test_short_file_is_rebuilt_by_concurrent_loads(tmp_path):
+    path = str(tmp_path / 'book.npy')
+    openingbook.build(path)
+    with open(path, 'rb') as file:
+        data = file.read()
+    with open(path, 'wb') as file:
+        file.write(data[:len(data) // 2])  # a book cut short by an interrupted write
+    with ProcessPoolExecutor(4) as pool:
+        sizes = list(pool.map(load_size, [path] * 8))
+    assert sizes == [len(openingbook.generate())] * 8
+    assert os.listdir(tmp_path) == ['book.npy']
@@ -0,0 +1,31 @@
+# Seeding: a seeded default generator repeats its draws, forked children do not share it, and the module imports without fork support
+
+import importlib
+import os
+import numpy as np
+import pytest
+import seeding
+
+
+def test_seed_repeats_the_default_stream():
+    first = seeding.seed(7).integers(1 << 30, size=4)
+    assert np.array_equal(seeding.seed(7).integers(1 << 30, size=4), first)
+
+
+def test_imports_without_register_at_fork(monkeypatch):
+    monkeypatch.delattr(os, 'register_at_fork', raising=False)
+    importlib.reload(seeding)
+    assert seeding.get_rng() is not None
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs fork")
+def test_forked_child_forgets_the_default():
+    importlib.reload(seeding)
+    parent = seeding.seed(3)
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write, b'1' if seeding.get_rng() is not parent else b'0')
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read, 1) == b'1'
@@ -0,0 +1,46 @@
+# Solver table: the values agree with a plain minimax search, and concurrent first use builds one whole table
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from engine import NUM_STATES, O, X, Position
+import solver
+
+
+def minimax(position):
+    if position.winner() is not None:
+        return -1
+    if position.is_full():
+        return 0
+    value = -1
+    for cell in position.legal_moves():
+        position.play(cell)
+        value = max(value, -minimax(position))
+        position.undo(cell)
+    return value
+
+
+def test_values_match_minimax():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        position = Position(turn=(X, O)[rng.integers(2)])
+        for _ in range(rng.integers(3, 8)):
+            if position.is_terminal():
+                break
+            moves = position.legal_moves()
+            position.play(moves[rng.integers(len(moves))])
+        assert solver.lookup(position)[0] == minimax(position)
+
+
+def load_values(path):
+    return solver.load(path)['value'].sum(dtype=np.int64)
+
+
+def test_concurrent_first_use_builds_a_whole_table(tmp_path):
+    path = str(tmp_path / 'values.bin')
+    open(path, 'wb').close()  # an empty file left behind by an interrupted build
+    with ProcessPoolExecutor(4) as pool:
+        sums = list(pool.map(load_values, [path] * 8))
+    assert len(set(sums)) == 1
+    assert os.path.getsize(path) == 2 * NUM_STATES * solver.TABLE_DTYPE.itemsize
+    assert os.listdir(tmp_path) == ['values.bin']
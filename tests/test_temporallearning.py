@@ -0,0 +1,28 @@
+# TD agent: it plays on the state types the game loops give it, with either value backend
+
+import numpy as np
+from agents import make_agent, play_game
+from engine import O, X
+from linearvalue import LinearValue
+from mnk import MNKBoard
+from temporallearning import TDAgent
+from valuetable import ValueTable
+
+
+# The interactive game keeps an MNKBoard and asks the agent for 'O' moves on a copy of it
+def test_table_agent_plays_on_the_interactive_board():
+    state = MNKBoard()
+    state.play(4)
+    agent = TDAgent(table=ValueTable())
+    cell = agent.select_move(state.copy())
+    assert cell in state.legal_moves()
+
+
+def test_agents_finish_games_on_mnk_boards():
+    rng = np.random.default_rng(0)
+    random_agent = make_agent('random')
+    for agent in (TDAgent(table=ValueTable()), TDAgent(table=LinearValue())):
+        for first in (X, O):
+            winner, moves, _ = play_game(agent, random_agent, first=first, rng=rng, state=MNKBoard(turn=first))
+            assert winner in (X, O, None)
+            assert len(set(moves)) == len(moves)
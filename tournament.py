@@ -0,0 +1,253 @@
+"""
+Script Name: Round-Robin Tournament with Bradley-Terry Ratings for the Tic-Tac-Toe Agents
+Description: This script plays every pair of registered agents against each other with colour swapping across a process pool, stops each match early with a sequential probability ratio test, and rates the agents on the Elo scale.
+Date: October 18, 2026
+"""
+
+# Agents are given as registered labels (REGISTRY) or as specs "agent:param=value,...", where `agent` is a name in the agent registry (agents.py) and the parameters are passed when the agent is created,
+# e.g. "mc:num_episodes=500,book=False" or "sparse:depth=2". The search variants in the registry have the opening book turned off, so their strength reflects their search budget.
+
+# Matches are played in chunks of games; each chunk alternates colours and also times every decision of both agents.
+# After each chunk the match is tested with two one-sided SPRTs on the score (normal approximation, as used for engine testing):
+#   "A is `elo1` stronger than B" against "equal", and the same for B. The match stops once either side is shown stronger,
+#   or both tests accept "equal" (no difference as large as `elo1`), or after `max_games`.
+
+# Ratings are the Bradley-Terry maximum-likelihood strengths (minorization-maximization, draws count half a win) on the Elo scale, with the random agent at 0 when it plays.
+# Every agent gets one virtual draw against each opponent so that agents that never lose (or never win) still get finite ratings.
+# The report lists rating, score, games and milliseconds per decision, i.e. strength against compute.
+
+# Examples:
+#   python tournament.py random mc mcts sparse td optimal
+#   python tournament.py random mc-100 mc-1000 mc-10000 --max-games 2000 --elo1 30
+
+
+import argparse
+import ast
+import itertools
+import json
+import math
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+
+# Label -> agent spec
+REGISTRY = {
+    'random': 'random',
+    'optimal': 'optimal',
+    'mc': 'mc',
+    'mcts': 'mcts',
+    'sparse': 'sparse',
+    'td': 'td:exploration_param=0',
+    'alphabeta': 'alphabeta',
+    'td-linear': "td:backend='linear',exploration_param=0",
+    'mc-100': 'mc:num_episodes=100,book=False',
+    'mc-1000': 'mc:num_episodes=1000,book=False',
+    'mc-10000': 'mc:num_episodes=10000,book=False',
+    'mcts-100': 'mcts:iterations=100,book=False',
+    'mcts-1000': 'mcts:iterations=1000,book=False',
+    'mcts-5000': 'mcts:iterations=5000,book=False',
+    'sparse-d2': 'sparse:depth=2,book=False',
+    'sparse-d4': 'sparse:depth=4,book=False',
+    'sparse-d6': 'sparse:depth=6,book=False',
+    'alphabeta-d2': 'alphabeta:max_depth=2',
+    'alphabeta-d4': 'alphabeta:max_depth=4',
+}
+
+CHUNK_GAMES = 20
+MAX_GAMES = 1000
+ELO1 = 50
+ALPHA = BETA = 0.05
+
+
+def register(label, spec):
+    REGISTRY[label] = spec
+
+# Split "agent:param=value,..." into the agent name and its parameters
+def parse_spec(spec):
+    name, _, params = spec.partition(':')
+    parsed = {}
+    for item in filter(None, params.split(',')):
+        key, value = item.split('=', 1)
+        parsed[key.strip()] = ast.literal_eval(value.strip())
+    return name, parsed
+
+# Create the agent for a spec
+def load_spec(spec):
+    from agents import make_agent
+    name, params = parse_spec(spec)
+    return make_agent(name, **params)
+
+
+# Worker: play `games` games between two specs, A taking X in even games; returns results and decision times
+def play_pair_chunk(spec_a, spec_b, games, seed_sequence):
+    from agents import play_game
+    from engine import O, X
+    from selfplay import seed_worker
+
+    rng = seed_worker(seed_sequence)
+    agent_a, agent_b = load_spec(spec_a), load_spec(spec_b)
+    results = Counter()
+    for game in range(games):
+        a_side = X if game % 2 == 0 else O
+        winner, _, seconds = play_game(*((agent_a, agent_b) if a_side == X else (agent_b, agent_a)), rng=rng)
+        # X moved first, so each side's decisions are every other entry of `seconds`
+        for side, label in ((a_side, 'a'), (a_side ^ 1, 'b')):
+            results[f'seconds_{label}'] += sum(seconds[side::2])
+            results[f'decisions_{label}'] += len(seconds[side::2])
+        results['draws' if winner is None else 'a_wins' if winner == a_side else 'b_wins'] += 1
+    return results
+
+
+# Expected score for an Elo difference
+def expected_score(elo):
+    return 1 / (1 + 10 ** (-elo / 400))
+
+# Log-likelihood ratio of "A is `elo1` stronger" against "equal" from A's wins, draws and losses
+def sprt_llr(wins, draws, losses, elo1=ELO1):
+    if wins + draws + losses == 0:
+        return 0.0
+    # One virtual win and loss keep the variance estimate above 0 when every game so far ended the same way
+    wins, losses = wins + 1, losses + 1
+    games = wins + draws + losses
+    score = (wins + draws / 2) / games
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    s0, s1 = 0.5, expected_score(elo1)
+    return games * (s1 - s0) * (2 * score - s0 - s1) / (2 * variance)
+
+# 'a' or 'b' if that side is shown stronger, 'equal' if neither is, None to keep playing
+def sprt_decision(wins, draws, losses, elo1=ELO1, alpha=ALPHA, beta=BETA):
+    lower, upper = math.log(beta / (1 - alpha)), math.log((1 - beta) / alpha)
+    llr_a, llr_b = sprt_llr(wins, draws, losses, elo1), sprt_llr(losses, draws, wins, elo1)
+    if llr_a >= upper:
+        return 'a'
+    if llr_b >= upper:
+        return 'b'
+    if llr_a <= lower and llr_b <= lower:
+        return 'equal'
+    return None
+
+
+# Bradley-Terry ratings on the Elo scale from {(a, b): Counter(a_wins, b_wins, draws)}
+def bradley_terry(matches, labels, iterations=1000, tolerance=1e-9):
+    index = {label: i for i, label in enumerate(labels)}
+    size = len(labels)
+    wins = np.zeros((size, size))
+    for (a, b), result in matches.items():
+        i, j = index[a], index[b]
+        wins[i, j] += result['a_wins'] + result['draws'] / 2
+        wins[j, i] += result['b_wins'] + result['draws'] / 2
+    played = (wins + wins.T) > 0
+    wins += 0.5 * played  # one virtual draw per pairing
+    games = wins + wins.T
+
+    strength = np.ones(size)
+    for _ in range(iterations):
+        denominators = (games / (strength[:, None] + strength[None, :])).sum(axis=1)
+        updated = wins.sum(axis=1) / denominators
+        updated /= np.exp(np.log(updated).mean())
+        if np.abs(updated - strength).max() < tolerance:
+            strength = updated
+            break
+        strength = updated
+
+    ratings = 400 * np.log10(strength)
+    if 'random' in index:
+        ratings -= ratings[index['random']]
+    return dict(zip(labels, ratings.tolist()))
+
+
+# Play the round robin between `labels` and return the match results and ratings
+def run_tournament(labels, workers=None, seed=None, chunk_games=CHUNK_GAMES, max_games=MAX_GAMES, elo1=ELO1):
+    specs = {label: REGISTRY.get(label, label) for label in labels}
+    pairs = list(itertools.combinations(labels, 2))
+    matches = {pair: Counter() for pair in pairs}
+    decisions = {}
+    # Chunk n of a match always gets the same seed and results are applied in chunk order, so the outcome does not depend on which worker finishes first;
+    # chunks that finish after the match was decided are discarded
+    pair_seeds = dict(zip(pairs, np.random.SeedSequence(seed).spawn(len(pairs))))
+    scheduled = Counter()
+    submitted, applied = Counter(), Counter()
+    finished = {pair: {} for pair in pairs}
+
+    with ProcessPoolExecutor(workers) as pool:
+        running = {}
+        queue = itertools.cycle(pairs)
+
+        # Keep the pool busy with chunks of undecided matches, one pairing after another
+        def fill():
+            idle = 0
+            while len(running) < 2 * (workers or os.cpu_count()) and idle < len(pairs):
+                pair = next(queue)
+                if pair in decisions or scheduled[pair] >= max_games:
+                    idle += 1
+                    continue
+                idle = 0
+                games = min(chunk_games, max_games - scheduled[pair])
+                scheduled[pair] += games
+                future = pool.submit(play_pair_chunk, specs[pair[0]], specs[pair[1]], games, pair_seeds[pair].spawn(1)[0])
+                running[future] = pair, submitted[pair]
+                submitted[pair] += 1
+
+        fill()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                pair, chunk = running.pop(future)
+                finished[pair][chunk] = future.result()
+                while pair not in decisions and applied[pair] in finished[pair]:
+                    result = matches[pair]
+                    result.update(finished[pair].pop(applied[pair]))
+                    applied[pair] += 1
+                    decision = sprt_decision(result['a_wins'], result['draws'], result['b_wins'], elo1)
+                    if decision is not None:
+                        decisions[pair] = decision
+            fill()
+
+    ratings = bradley_terry(matches, labels)
+    return matches, decisions, ratings
+
+# Rating table with score and compute per agent
+def standings(labels, matches, ratings):
+    rows = []
+    for label in labels:
+        games = score = seconds = moves = 0
+        for (a, b), result in matches.items():
+            if label not in (a, b):
+                continue
+            side, other = ('a', 'b') if label == a else ('b', 'a')
+            games += result['a_wins'] + result['b_wins'] + result['draws']
+            score += result[f'{side}_wins'] + result['draws'] / 2
+            seconds += result[f'seconds_{side}']
+            moves += result[f'decisions_{side}']
+        rows.append({'agent': label, 'rating': ratings[label], 'games': games, 'score': score / games if games else 0.0,
+                     'ms_per_decision': 1000 * seconds / moves if moves else 0.0})
+    return sorted(rows, key=lambda row: -row['rating'])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Round-robin tournament between Tic-Tac-Toe agents")
+    parser.add_argument('agents', nargs='+', help=f"registered labels ({', '.join(REGISTRY)}) or specs like mc:num_episodes=500")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--chunk-games', type=int, default=CHUNK_GAMES, help="games per scheduled chunk (even, for colour balance)")
+    parser.add_argument('--max-games', type=int, default=MAX_GAMES, help="games per match if SPRT does not stop it earlier")
+    parser.add_argument('--elo1', type=float, default=ELO1, help="Elo difference the SPRT tries to detect")
+    parser.add_argument('--output', help="write matches and ratings as JSON to this file")
+    args = parser.parse_args()
+
+    matches, decisions, ratings = run_tournament(args.agents, args.workers, args.seed, args.chunk_games, args.max_games, args.elo1)
+    for (a, b), result in matches.items():
+        games = result['a_wins'] + result['b_wins'] + result['draws']
+        verdict = {'a': f"{a} stronger", 'b': f"{b} stronger", 'equal': "no difference"}.get(decisions.get((a, b)), "undecided")
+        print(f"{a} vs {b}: +{result['a_wins']} ={result['draws']} -{result['b_wins']} in {games} games ({verdict})")
+    print()
+    table = standings(args.agents, matches, ratings)
+    for row in table:
+        print(f"{row['agent']:12s} {row['rating']:8.1f} Elo  score {row['score']:.3f} over {row['games']} games  {row['ms_per_decision']:8.3f} ms/decision")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'matches': {f"{a} vs {b}": dict(result) for (a, b), result in matches.items()},
+                       'decisions': {f"{a} vs {b}": decision for (a, b), decision in decisions.items()},
+                       'standings': table}, file, indent=2)
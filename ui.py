@@ -0,0 +1,274 @@
+"""
+Script Name: Interactive Pygame Front End and Plots for Tic-Tac-Toe
+Description: This module holds the Pygame window, board drawing, the human-versus-computer game loop and the matplotlib plots, so the agent modules can be imported without a display.
+Date: October 18, 2026
+"""
+
+# Pygame and matplotlib are only imported when a window or a plot is actually requested: `play_interactive` opens the window on first use and `plot_efficiency` / `plot_comparison` / `plot_metrics` import matplotlib when called.
+# Importing the agent modules (`monteclaro`, `sparsesampling`, `temporallearning`) therefore never touches a display.
+
+# `play_interactive(agent)` runs the game loop: the human plays X with the mouse, the computer plays O with `agent.select_move`, the agent observes every move,
+# and the winner, the regret of the computer's moves and the measured time of each computer decision are yielded after each game.
+# The loop is event driven: it sleeps in `pygame.event.wait()` until a click, a window exposure or the computer's move arrives, and handles at most FRAME_RATE events a second.
+# The computer's move is computed on a background thread and comes back as an event, so the window stays responsive while the agent searches.
+# The board is drawn in full only at the start of a game and when the window is exposed; a move redraws and updates just its own cell.
+# `play_and_report` is the main function of the agent scripts: it plays a registered agent interactively and reports and plots its metrics.
+# The board size and win length are parameters: the drawing scales to any m x n grid and the game state is an `MNKBoard`, which only checks lines through the last move.
+
+
+import sys
+import threading
+import time
+from agents import Transition
+from engine import BOARD_ROWS, BOARD_COLS, O, X, Position
+from mnk import MNKBoard
+from seeding import get_rng
+from solver import move_regret
+
+# Define constants
+WIDTH, HEIGHT = 300, 300
+LINE_WIDTH = 15
+WHITE = (255, 255, 255)
+LINE_COLOR = (23, 145, 135)
+BOARD_COLOR = (44, 44, 44)
+X_COLOR = (66, 66, 255)
+O_COLOR = (255, 66, 66)
+FRAME_RATE = 30  # at most this many events are handled per second
+
+screen = None
+
+
+# Initialize Pygame and set up the screen on first use
+def init_display():
+    global screen
+    if screen is None:
+        import pygame
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Tic Tac Toe")
+        screen.fill(WHITE)
+    return screen
+
+# Size of one cell in pixels for a board with `rows` x `cols` cells
+def square_size(rows, cols):
+    return min(WIDTH // cols, HEIGHT // rows)
+
+# Draw lines
+def draw_lines(rows=BOARD_ROWS, cols=BOARD_COLS):
+    import pygame
+    size = square_size(rows, cols)
+    line_width = max(1, LINE_WIDTH * 3 // max(rows, cols))
+    # Horizontal lines
+    for row in range(1, rows):
+        pygame.draw.line(screen, LINE_COLOR, (0, row * size), (cols * size, row * size), line_width)
+    # Vertical lines
+    for col in range(1, cols):
+        pygame.draw.line(screen, LINE_COLOR, (col * size, 0), (col * size, rows * size), line_width)
+
+# Draw the X or O symbol in one cell
+def draw_symbol(board, row, col):
+    import pygame
+    rows, cols = len(board), len(board[0])
+    size = square_size(rows, cols)
+    line_width = max(1, LINE_WIDTH * 3 // max(rows, cols))
+    if board[row][col] == 'X':
+        pygame.draw.line(screen, X_COLOR, (col * size + size // 4, row * size + size // 4),
+                         ((col + 1) * size - size // 4, (row + 1) * size - size // 4), line_width)
+        pygame.draw.line(screen, X_COLOR, ((col + 1) * size - size // 4, row * size + size // 4),
+                         (col * size + size // 4, (row + 1) * size - size // 4), line_width)
+    elif board[row][col] == 'O':
+        pygame.draw.circle(screen, O_COLOR, (col * size + size // 2, row * size + size // 2), size // 4, line_width)
+
+# Draw X and O symbols
+def draw_symbols(board):
+    for row in range(len(board)):
+        for col in range(len(board[0])):
+            draw_symbol(board, row, col)
+
+# Draw the whole board and show it
+def draw_board(board):
+    import pygame
+    screen.fill(WHITE)
+    draw_lines(len(board), len(board[0]))
+    draw_symbols(board)
+    pygame.display.update()
+
+# Draw the symbol just placed in one cell and show only that cell; the symbol stays inside the cell, clear of the grid lines
+def redraw_cell(board, row, col):
+    import pygame
+    size = square_size(len(board), len(board[0]))
+    draw_symbol(board, row, col)
+    pygame.display.update(pygame.Rect(col * size, row * size, size, size))
+
+# Compute the agent's move for `state` on a background thread and post it as an `event_type` event with the cell and the seconds the decision took,
+# so the window keeps handling events while the agent searches; the thread is a daemon so closing the window does not wait for the search
+def start_decision(agent, state, event_type):
+    import pygame
+
+    def decide():
+        start = time.perf_counter()
+        cell = agent.select_move(state)
+        pygame.event.post(pygame.event.Event(event_type, cell=cell, seconds=time.perf_counter() - start))
+
+    threading.Thread(target=decide, daemon=True).start()
+
+# Report the result after `turn` moved; returns True if the game is over
+def game_finished(state, turn):
+    if state.winner() is not None:
+        print(f"Player {turn} wins!")
+        return True
+    if state.is_full():
+        print("It's a tie!")
+        return True
+    return False
+
+# Human (X) versus computer (O) game loop on a `rows` x `cols` board where `k` in a row wins; `agent` is an agent (see agents.py) that sees every move
+# Yields (winner, regret of O's moves, seconds per O decision) after each game; regret is only measured on the standard 3x3 game
+# `rng` picks who starts each game; the agent draws from the default generator
+def play_interactive(agent, games=5, rows=BOARD_ROWS, cols=BOARD_COLS, k=3, rng=None):
+    import pygame
+    rng = get_rng(rng)
+    init_display()
+    size = square_size(rows, cols)
+    standard_game = (rows, cols, k) == (BOARD_ROWS, BOARD_COLS, 3)
+    computer_move = pygame.USEREVENT
+    pygame.event.set_allowed(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE, computer_move])
+    clock = pygame.time.Clock()
+
+    for game in range(games):
+        board = [[' ' for _ in range(cols)] for _ in range(rows)]
+        state = MNKBoard(rows, cols, k)
+        agent.reset()
+        game_over = False
+        turn = ('X', 'O')[rng.integers(2)]
+        game_regret = 0
+        decision_times = []
+        draw_board(board)
+
+        while not game_over:
+            if turn == 'O':
+                state.turn = O
+                start_decision(agent, state.copy(), computer_move)
+                turn = None  # thinking
+
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            elif event.type == pygame.VIDEOEXPOSE:
+                draw_board(board)
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and turn == 'X':
+                x, y = event.pos
+                row = y // size
+                col = x // size
+                if row < rows and col < cols and board[row][col] == ' ':
+                    board[row][col] = 'X'
+                    state.turn = X
+                    state.play(row * cols + col)
+                    agent.observe(Transition(X, row * cols + col, state))
+                    redraw_cell(board, row, col)
+                    game_over = game_finished(state, 'X')
+                    turn = 'O'
+                else:
+                    print("Invalid move. Try again.")
+
+            elif event.type == computer_move:
+                decision_times.append(event.seconds)
+                row, col = divmod(event.cell, cols)
+                if standard_game:
+                    game_regret += move_regret(Position.from_board(board, turn=O), event.cell)
+                board[row][col] = 'O'
+                state.play(event.cell)
+                agent.observe(Transition(O, event.cell, state))
+                redraw_cell(board, row, col)
+                game_over = game_finished(state, 'O')
+                turn = 'X'
+
+            clock.tick(FRAME_RATE)
+
+        yield state.winner(), game_regret, decision_times
+
+# Play `games` interactive games against the registered agent `name` (created with `params`), print the metrics after each game,
+# plot the efficiency per game and return it
+def play_and_report(name, label, games=5, **params):
+    from agents import make_agent
+    from metrics import GameMetrics
+
+    metrics = GameMetrics()
+    efficiency_values = []
+
+    for game, (winner, game_regret, decision_times) in enumerate(play_interactive(make_agent(name, **params), games)):
+        reward = 1 if winner == O else -1 if winner == X else 0
+        # Add the game to the running evaluation metrics
+        metrics.update(reward, game_regret, decision_times)
+        efficiency_values.append(len(decision_times) / sum(decision_times) if decision_times else 0.0)
+
+        # Print evaluation criteria after the current game
+        print(f"--- Evaluation Results after Game {game + 1} ---")
+        print(metrics.summary())
+
+    print(f"\nEvaluation Results after {games} games:")
+    print(metrics.report(label))
+
+    # Plot efficiency values
+    plot_efficiency(efficiency_values)
+
+    return efficiency_values
+
+# Plot efficiency values of one algorithm over its games
+def plot_efficiency(efficiency_values):
+    import matplotlib.pyplot as plt
+    games = len(efficiency_values)
+    plt.plot(range(1, games + 1), efficiency_values, marker='o')
+    plt.title(f'Efficiency of the Algorithm over {games} Games')
+    plt.xlabel('Game Number')
+    plt.ylabel('Efficiency (decisions per second)')
+    plt.grid(True)
+    plt.show()
+
+# Bar charts of measured metrics of several algorithms, given as {label: GameMetrics}
+def plot_metrics(results, opponent):
+    import matplotlib.pyplot as plt
+    labels = list(results)
+    summaries = [results[label].summary() for label in labels]
+    positions = range(len(labels))
+    figure, (strength, regret, speed) = plt.subplots(1, 3, figsize=(15, 4.5))
+
+    win_rates = [summary['Win Rate'] for summary in summaries]
+    errors = [[rate - summary['Win Rate CI'][0] for rate, summary in zip(win_rates, summaries)],
+              [summary['Win Rate CI'][1] - rate for rate, summary in zip(win_rates, summaries)]]
+    strength.bar(positions, win_rates, yerr=errors, capsize=6, label='Win')
+    strength.bar(positions, [summary['Draw Rate'] for summary in summaries], bottom=win_rates, alpha=0.5, label='Draw')
+    strength.set_title(f'Results against {opponent} (95% CI)')
+    strength.set_ylabel('Rate')
+    strength.legend()
+
+    regret.bar(positions, [summary['Regret per Move'] for summary in summaries])
+    regret.set_title('Regret per Move against Perfect Play')
+
+    speed.bar(positions, [summary['Efficiency'] for summary in summaries])
+    speed.set_yscale('log')
+    speed.set_title('Efficiency (decisions per second)')
+
+    for axes in (strength, regret, speed):
+        axes.set_xticks(list(positions))
+        axes.set_xticklabels(labels, rotation=15)
+        axes.grid(True, axis='y')
+    figure.tight_layout()
+    plt.show()
+
+# Plot efficiency values of several algorithms, given as {label: values}
+def plot_comparison(efficiency_values):
+    import matplotlib.pyplot as plt
+    games = min(len(values) for values in efficiency_values.values())
+    for label, values in efficiency_values.items():
+        plt.plot(range(1, games + 1), values[:games], marker='o', label=label)
+    plt.title(f'Efficiency Comparison of Algorithms over {games} Games')
+    plt.xlabel('Game Number')
+    plt.ylabel('Efficiency (decisions per second)')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,64 @@
+"""
+Script Name: Tabular Value Function for Temporal Difference Learning
+Description: This module stores learned Tic-Tac-Toe state values in a dense NumPy float32 array and updates them with TD(0) or TD(lambda) with eligibility traces.
+Date: October 18, 2026
+"""
+
+# Every state has an integer ID: the player to move times 3^9 plus the base-3 index of the canonical (symmetry-reduced) board, so a lookup is a single array access
+# and the 8 symmetric copies of a position share one value.
+# Values are expected outcomes for 'O' (1 win, 0 draw, -1 loss) and start at 0.
+
+# TD(0) moves one state's value towards a target. TD(lambda) replays a finished episode with accumulating eligibility traces, so every state visited in the episode shares the error of each step.
+
+# The table is saved to and loaded from a `.npy` file so that learning carries over between runs.
+
+
+import os
+import numpy as np
+from engine import NUM_STATES, O, X
+from symmetry import canonical_index
+
+VALUES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'td_values.npy')
+
+
+class ValueTable:
+    def __init__(self, values=None):
+        self.values = values if values is not None else np.zeros(2 * NUM_STATES, dtype=np.float32)
+
+    # State ID of a position
+    @staticmethod
+    def state_id(position):
+        return position.turn * NUM_STATES + canonical_index(position.bits[X], position.bits[O])
+
+    def value(self, position):
+        return float(self.values[self.state_id(position)])
+
+    # TD(0): move the value of `state` towards `target`, return the TD error
+    def td0_update(self, state, target, learning_rate=0.1):
+        delta = target - self.values[state]
+        self.values[state] += learning_rate * delta
+        return delta
+
+    # TD(lambda) over one episode: `states` are the state IDs in visiting order and `reward` is the final outcome
+    def td_lambda_update(self, states, reward, learning_rate=0.1, discount_factor=0.9, trace_decay=0.8):
+        states = np.asarray(states, dtype=np.intp)
+        traces = np.zeros(len(states), dtype=np.float32)
+        for t in range(len(states)):
+            if t + 1 < len(states):
+                target = discount_factor * self.values[states[t + 1]]
+            else:
+                target = reward
+            delta = target - self.values[states[t]]
+            traces *= discount_factor * trace_decay
+            traces[t] += 1.0
+            self.values[states[:t + 1]] += learning_rate * delta * traces[:t + 1]
+
+    def save(self, path=VALUES_PATH):
+        np.save(path, self.values)
+
+    # Load a saved table, or start a new one if the file does not exist
+    @classmethod
+    def load(cls, path=VALUES_PATH):
+        if os.path.exists(path):
+            return cls(np.load(path).astype(np.float32, copy=False))
+        return cls()